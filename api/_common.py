@@ -0,0 +1,640 @@
+"""Shared response handling and retry helpers for the Trestle API clients."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import re
+import time
+import weakref
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Generic, NoReturn, TypeVar
+
+import httpx
+from pydantic_core import from_json
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Configure retry settings
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+MIN_RETRY_DELAY = 1  # seconds
+MAX_RETRY_DELAY = 10  # seconds
+MAX_RETRY_AFTER = 120  # seconds, longest server-requested wait honored
+RETRY_AFTER_LIMIT = 1800.0  # seconds, cap on parsed Retry-After values
+
+# Configure response cache settings
+CACHE_MAX_SIZE = 10_000
+CACHE_TTL = 300.0  # seconds
+
+# Configure batch lookup settings
+BATCH_CONCURRENCY = 20
+
+# Configure adaptive concurrency settings
+LIMITER_MAX_CONCURRENCY = 32
+LIMITER_LATENCY_TARGET = 2.0  # seconds
+LIMITER_WINDOW = 32  # requests
+
+# Configure client-side admission rate
+MAX_REQUEST_RATE = 100.0  # requests per second
+
+# Picks the delay before a retry from the attempt number that just failed,
+# the previous delay (0 before the first retry) and the raised exception
+WaitStrategy = Callable[[int, float, Exception], float]
+
+# Transport-level failures are always worth another attempt
+_TRANSPORT_ERRORS = (httpx.RequestError, httpx.HTTPStatusError)
+
+# Separators accepted in local formats, stripped before matching _PHONE_RE
+_PHONE_SEPARATOR_RE = re.compile(r"[\s().-]+")
+# E.164 with a leading "+", or 7-15 digits in local format
+_PHONE_RE = re.compile(r"^(?:\+[1-9]\d{6,14}|\d{7,15})$")
+
+
+def is_valid_phone(phone: str) -> bool:
+    """Cheaply check that ``phone`` looks like an E.164 or local number."""
+    return _PHONE_RE.match(_PHONE_SEPARATOR_RE.sub("", phone)) is not None
+
+
+@dataclass(frozen=True)
+class ErrorTypes:
+    """Exception classes an API raises for each kind of error response.
+
+    Args:
+        invalid: Raised for 400 responses.
+        invalid_message: Message prefix for 400 responses.
+        authentication: Raised for 401 and 403 responses.
+        rate_limit: Raised for 429 responses.
+        server: Raised for 5xx responses; takes the server's ``retry_after``.
+        api: Raised for any other unsuccessful response.
+        invalid_detail: Fallback detail when a 400 body carries no message.
+
+    ``retryable`` is derived from the other fields and is not passed in.
+    """
+    invalid: type[Exception]
+    invalid_message: str
+    authentication: type[Exception]
+    rate_limit: type[Exception]
+    server: type[Exception]
+    api: type[Exception]
+    invalid_detail: str = "Unknown error"
+    retryable: tuple[type[Exception], ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Precompute the isinstance tuple checked on every failed attempt
+        object.__setattr__(
+            self, "retryable", (self.rate_limit, self.server, *_TRANSPORT_ERRORS)
+        )
+
+
+def retry_after_from_headers(headers: httpx.Headers) -> float | None:
+    """Return the server's requested retry delay in seconds, if it sent one.
+
+    ``Retry-After`` may be a number of seconds or an HTTP date. When it is
+    absent, ``X-RateLimit-Reset`` is used instead, either as seconds to wait
+    or as the Unix time at which the limit resets.
+
+    Args:
+        headers: The response headers.
+
+    Returns:
+        The delay in seconds, capped at ``RETRY_AFTER_LIMIT``, or ``None`` if
+        no usable header was sent.
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(RETRY_AFTER_LIMIT, max(0.0, delay))
+
+    reset = _seconds_until_reset(headers)
+    return None if reset is None else min(RETRY_AFTER_LIMIT, reset)
+
+
+def _seconds_until_reset(headers: httpx.Headers) -> float | None:
+    reset = headers.get("X-RateLimit-Reset")
+    if reset is None:
+        return None
+    try:
+        reset_value = float(reset)
+    except ValueError:
+        return None
+    # Values this large are epoch timestamps rather than relative delays
+    if reset_value > 1_000_000_000:
+        reset_value -= time.time()
+    return max(0.0, reset_value)
+
+
+def wait_exponential(attempt: int, previous: float, exception: Exception) -> float:
+    """Wait ``2 ** (attempt - 1)`` seconds, clamped to the retry delay bounds."""
+    return min(MAX_RETRY_DELAY, max(MIN_RETRY_DELAY, 2 ** (attempt - 1)))
+
+
+def wait_retry_after(fallback: WaitStrategy, cap: float = MAX_RETRY_AFTER) -> WaitStrategy:
+    """Build a wait strategy that honors the server's retry delay.
+
+    When the failed attempt raised an exception carrying a truthy
+    ``retry_after``, that many seconds (at most ``cap``) are waited;
+    otherwise ``fallback`` picks the delay.
+
+    Args:
+        fallback: Wait strategy used when no delay was requested.
+        cap: Maximum delay in seconds.
+
+    Returns:
+        A wait strategy for ``call_with_retries``.
+    """
+
+    def _wait(attempt: int, previous: float, exception: Exception) -> float:
+        retry_after = getattr(exception, "retry_after", None)
+        if retry_after:
+            return min(cap, float(retry_after))
+        return fallback(attempt, previous, exception)
+
+    return _wait
+
+
+def wait_exponential_jitter(
+    base: float = 0.5,
+    cap: float = MAX_RETRY_AFTER,
+) -> WaitStrategy:
+    """Build a wait strategy using exponential backoff with additive jitter.
+
+    The n-th retry waits ``2 ** n * base`` seconds plus up to ``base`` more
+    at random, capped at ``cap``.
+
+    Args:
+        base: Scale of the backoff and of the jitter, in seconds.
+        cap: Maximum delay in seconds.
+
+    Returns:
+        A wait strategy for ``call_with_retries``.
+    """
+
+    def _wait(attempt: int, previous: float, exception: Exception) -> float:
+        return min(cap, 2 ** attempt * base + random.random() * base)
+
+    return _wait
+
+
+def wait_decorrelated_jitter(
+    base: float = 0.1,
+    cap: float = MAX_RETRY_DELAY,
+) -> WaitStrategy:
+    """Build a wait strategy using decorrelated jitter.
+
+    Each delay is drawn uniformly between ``base`` and three times the
+    previous delay, capped at ``cap``, so concurrent callers spread their
+    retries out instead of retrying in lockstep.
+
+    Args:
+        base: Minimum delay, and the seed for the first draw, in seconds.
+        cap: Maximum delay in seconds.
+
+    Returns:
+        A wait strategy for ``call_with_retries``.
+    """
+
+    def _wait(attempt: int, previous: float, exception: Exception) -> float:
+        return min(cap, random.uniform(base, (previous or base) * 3))
+
+    return _wait
+
+
+def _error_body(response: httpx.Response) -> dict[str, Any]:
+    """Decode an error body once; an empty or non-JSON-object body gives no details."""
+    if not response.content:
+        return {}
+    try:
+        body = from_json(response.content)
+    except ValueError:
+        return {}
+    return body if isinstance(body, dict) else {}
+
+
+def _raise_invalid(response: httpx.Response, errors: ErrorTypes) -> NoReturn:
+    error_data = _error_body(response)
+    raise errors.invalid(
+        errors.invalid_message,
+        error_data,
+        detail_default=errors.invalid_detail,
+    )
+
+
+def _raise_unauthorized(response: httpx.Response, errors: ErrorTypes) -> NoReturn:
+    raise errors.authentication("Invalid API key")
+
+
+def _raise_forbidden(response: httpx.Response, errors: ErrorTypes) -> NoReturn:
+    raise errors.authentication("Forbidden - check API key permissions")
+
+
+def _raise_rate_limited(response: httpx.Response, errors: ErrorTypes) -> NoReturn:
+    raise errors.rate_limit(retry_after=retry_after_from_headers(response.headers))
+
+
+def _raise_server_error(response: httpx.Response, errors: ErrorTypes) -> NoReturn:
+    raise errors.server(
+        "Server error occurred",
+        retry_after=retry_after_from_headers(response.headers),
+    )
+
+
+def _raise_api_error(response: httpx.Response, errors: ErrorTypes) -> NoReturn:
+    error_data = _error_body(response)
+    raise errors.api(
+        "API error",
+        status_code=response.status_code,
+        details=error_data,
+        detail_default="Unknown error",
+    )
+
+
+_STATUS_HANDLERS: dict[int, Callable[[httpx.Response, ErrorTypes], NoReturn]] = {
+    400: _raise_invalid,
+    401: _raise_unauthorized,
+    403: _raise_forbidden,
+    429: _raise_rate_limited,
+}
+
+
+def raise_for_status(response: httpx.Response, errors: ErrorTypes) -> None:
+    """Raise the API-specific exception for an unsuccessful response.
+
+    The response body is only decoded on the error branches that need it, so
+    successful responses pass through without touching the payload.
+
+    Args:
+        response: The HTTP response to check.
+        errors: The exception classes of the calling API.
+    """
+    if response.is_success:
+        return
+    status_code = response.status_code
+    handler = _STATUS_HANDLERS.get(status_code)
+    if handler is None:
+        handler = _raise_server_error if status_code >= 500 else _raise_api_error
+    handler(response, errors)
+
+
+def should_retry_error(exception: Exception, errors: ErrorTypes) -> bool:
+    """Determine if the request should be retried based on the exception."""
+    if isinstance(exception, errors.retryable):
+        return True
+    return isinstance(exception, errors.api) and exception.status_code in RETRY_STATUS_CODES
+
+
+async def call_with_retries(
+    call: Callable[[], Awaitable[T]],
+    errors: ErrorTypes,
+    name: str,
+    wait: WaitStrategy = wait_exponential,
+    *,
+    max_attempts: int = MAX_RETRIES,
+) -> T:
+    """Await ``call``, retrying retryable errors up to ``max_attempts`` attempts.
+
+    This is the only retry layer: the shared client's transport does not
+    retry, so ``max_attempts`` bounds the requests made for one lookup.
+
+    Args:
+        call: Zero-argument coroutine factory issuing a single attempt.
+        errors: The exception classes of the calling API.
+        name: Operation name used in retry log messages.
+        wait: Picks the delay before each retry; exponential backoff by default.
+        max_attempts: Total attempts, including the first.
+
+    Returns:
+        The result of the first successful attempt.
+
+    Raises:
+        errors.api: With status code 0 once a transport error exhausts the
+            attempts; the ``httpx.RequestError`` is chained as its cause.
+    """
+    delay = 0.0
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return await call()
+        except Exception as e:
+            if attempt >= max_attempts or not should_retry_error(e, errors):
+                if isinstance(e, httpx.RequestError):
+                    logger.error("Request failed: %s", e)
+                    raise errors.api(f"Request failed: {str(e)}", status_code=0) from e
+                raise
+            delay = wait(attempt, delay, e)
+            logger.warning("Retrying %s in %.2f seconds as it raised %s.", name, delay, e)
+            await asyncio.sleep(delay)
+
+
+async def gather_bounded(
+    calls: Iterable[Callable[[], Awaitable[T]]],
+    concurrency: int = BATCH_CONCURRENCY,
+) -> list[T | Exception]:
+    """Await ``calls`` concurrently, running at most ``concurrency`` at once.
+
+    Args:
+        calls: Zero-argument coroutine factories, one per lookup.
+        concurrency: Maximum number of lookups in flight.
+
+    Returns:
+        One result per call, in order; failed calls yield their exception.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(call: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await call()
+
+    return await asyncio.gather(*(_run(call) for call in calls), return_exceptions=True)
+
+
+def _retrieve_exception(task: asyncio.Task[Any]) -> None:
+    """Mark a fetch's exception as retrieved in case every waiter was cancelled."""
+    if not task.cancelled():
+        task.exception()
+
+
+class ResponseCache(Generic[T]):
+    """Bounded TTL cache of successful responses keyed by request parameters.
+
+    Concurrent lookups for a key that is already in flight wait for the first
+    request instead of issuing their own. That request runs in its own task,
+    so it still completes for the others if the caller that started it is
+    cancelled. Failed lookups are not cached, except for ``throttle_error``
+    exceptions carrying a ``retry_after``: until the server's retry window has
+    passed, lookups for that key raise a new ``throttle_error`` reporting the
+    time left.
+
+    Cached responses are shared between callers and should be treated as
+    read-only.
+
+    Args:
+        max_size: Maximum number of responses kept; the least recently used
+            entry is evicted first. ``0`` disables caching, but concurrent
+            identical lookups are still coalesced into one request.
+        ttl: Seconds a response stays valid.
+        throttle_error: Rate-limit exception type to cache as a negative entry;
+            it must accept a ``retry_after`` keyword argument.
+    """
+
+    def __init__(
+        self,
+        max_size: int = CACHE_MAX_SIZE,
+        ttl: float = CACHE_TTL,
+        throttle_error: type[Exception] | None = None,
+    ) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._throttle_error = throttle_error
+        # Each entry is (expires_at, response, throttled); throttled entries
+        # hold no response and mark the key as rate limited until expires_at
+        self._entries: OrderedDict[Hashable, tuple[float, T | None, bool]] = OrderedDict()
+        self._in_flight: dict[Hashable, asyncio.Task[T]] = {}
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached response for ``key``, fetching it on a miss.
+
+        Args:
+            key: Hashable form of the request parameters.
+            fetch: Zero-argument coroutine factory producing the response.
+
+        Returns:
+            The cached or freshly fetched response.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value, throttled = entry
+            now = time.monotonic()
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                if throttled:
+                    raise self._throttle_error(retry_after=expires_at - now)
+                return value
+            del self._entries[key]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            # Fetch in a task of its own so that cancelling the caller that
+            # started it does not cancel the callers waiting on the same key
+            task = asyncio.create_task(self._fetch(key, fetch))
+            task.add_done_callback(_retrieve_exception)
+            self._in_flight[key] = task
+        return await asyncio.shield(task)
+
+    async def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fetch`` for ``key`` and cache its outcome."""
+        try:
+            value = await fetch()
+        except Exception as e:
+            retry_after = getattr(e, "retry_after", None)
+            if self._throttle_error is not None and isinstance(e, self._throttle_error) and retry_after:
+                self._store(key, (time.monotonic() + retry_after, None, True))
+            raise
+        else:
+            self._store(key, (time.monotonic() + self._ttl, value, False))
+            return value
+        finally:
+            del self._in_flight[key]
+
+    def _store(self, key: Hashable, entry: tuple[float, T | None, bool]) -> None:
+        if self._max_size <= 0:
+            return
+        self._entries[key] = entry
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+
+class AIMDLimiter:
+    """Adaptive cap on concurrent requests to one API.
+
+    The cap grows by half a request after each fast, successful response and
+    halves after a rate-limited response, a retryable server error, a
+    transport failure, or when the mean latency of the recent window exceeds
+    ``latency_target``. It backs off at most once per ``latency_target`` so a
+    burst of failures from one overloaded period doesn't collapse it to one.
+
+    Args:
+        initial_limit: Concurrent requests allowed before any feedback.
+        max_limit: Upper bound of the cap.
+        latency_target: Mean latency in seconds above which the cap shrinks.
+        window: Number of recent request durations averaged.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = BATCH_CONCURRENCY,
+        max_limit: int = LIMITER_MAX_CONCURRENCY,
+        latency_target: float = LIMITER_LATENCY_TARGET,
+        window: int = LIMITER_WINDOW,
+    ) -> None:
+        self._limit = float(min(initial_limit, max_limit))
+        self._max_limit = max_limit
+        self._latency_target = latency_target
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._last_decrease = float("-inf")
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return max(1, int(self._limit))
+
+    async def run(self, call: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Await ``call`` once a slot is free and adjust the cap from its outcome.
+
+        Args:
+            call: Zero-argument coroutine factory issuing the request.
+
+        Returns:
+            The response returned by ``call``.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        started = time.monotonic()
+        try:
+            response = await call()
+        except httpx.RequestError:
+            self._decrease()
+            raise
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+        if response.status_code in RETRY_STATUS_CODES:
+            self._decrease()
+            return response
+        self._latencies.append(time.monotonic() - started)
+        if sum(self._latencies) / len(self._latencies) > self._latency_target:
+            self._decrease()
+        else:
+            self._limit = min(self._max_limit, self._limit + 0.5)
+        return response
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self._latency_target:
+            return
+        self._last_decrease = now
+        self._limit = max(1.0, self._limit * 0.5)
+
+
+class TokenBucket:
+    """Client-side cap on the rate at which requests are sent.
+
+    Up to ``capacity`` requests go out immediately; beyond that, callers wait
+    their turn so that no more than ``rate`` requests start per second. A
+    burst is smoothed locally instead of being rejected by the server's rate
+    limit and retried.
+
+    Args:
+        rate: Requests admitted per second.
+        capacity: Largest burst admitted at once. Defaults to ``rate``.
+    """
+
+    def __init__(self, rate: float = MAX_REQUEST_RATE, capacity: float | None = None) -> None:
+        self._rate = rate
+        self._capacity = rate if capacity is None else capacity
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        # Reserve the token up front, so concurrent callers queue behind each other
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self._rate)
+
+
+class RateLimitTracker:
+    """Request budget advertised by the server's rate-limit headers.
+
+    ``update`` records ``X-RateLimit-Limit``, ``X-RateLimit-Remaining`` and
+    ``X-RateLimit-Reset`` from each response; ``wait`` then holds the next
+    request until the window resets once fewer than 10% of the requests (and
+    at least two) are left, instead of spending them on 429 responses. Each
+    admitted request is counted against the budget until the next response
+    reports it again.
+
+    Args:
+        max_wait: Longest wait in seconds. A window resetting later (such as
+            a daily quota) is not waited out; the request goes ahead and any
+            429 response is left to the retry layer.
+    """
+
+    def __init__(self, max_wait: float = MAX_RETRY_AFTER) -> None:
+        self._max_wait = max_wait
+        self._limit: int | None = None
+        self._remaining: int | None = None
+        self._reset_at = 0.0
+
+    def update(self, headers: httpx.Headers) -> None:
+        """Record the budget reported by a response."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        try:
+            self._remaining = int(remaining)
+            limit = headers.get("X-RateLimit-Limit")
+            if limit is not None:
+                self._limit = int(limit)
+        except ValueError:
+            return
+        reset = _seconds_until_reset(headers)
+        if reset is not None:
+            self._reset_at = time.monotonic() + reset
+
+    async def wait(self) -> None:
+        """Sleep until the window resets if the remaining budget is nearly spent."""
+        if self._remaining is None:
+            return
+        threshold = max(2, (self._limit or 0) * 0.1)
+        if self._remaining > threshold:
+            self._remaining -= 1
+            return
+        delay = min(self._max_wait, self._reset_at - time.monotonic())
+        if delay > 0:
+            logger.warning("Rate limit budget nearly spent; waiting %.2f seconds.", delay)
+            await asyncio.sleep(delay)
+        # The window has reset; the next response reports the new budget
+        self._remaining = None
+
+
+_RATE_LIMIT_TRACKERS: weakref.WeakValueDictionary[tuple[str, str], RateLimitTracker] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def rate_limit_tracker(base_url: str, api_key: str) -> RateLimitTracker:
+    """Return the tracker shared by every client using ``api_key`` on ``base_url``.
+
+    The budget belongs to the key rather than to one client instance, so
+    clients for the same key share a tracker for as long as any of them holds
+    a reference to it.
+    """
+    key = (base_url, api_key)
+    tracker = _RATE_LIMIT_TRACKERS.get(key)
+    if tracker is None:
+        tracker = RateLimitTracker()
+        _RATE_LIMIT_TRACKERS[key] = tracker
+    return tracker
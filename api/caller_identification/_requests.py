@@ -1,6 +1,8 @@
 """Request models for the Caller Identification API."""
 
-from pydantic import BaseModel, Field, HttpUrl
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CallerIDRequest(BaseModel):
@@ -9,12 +11,12 @@ class CallerIDRequest(BaseModel):
     phone: str = Field(
         ...,
         description="The phone number in E.164 or local format.",
-        example="2069735100",
+        examples=["2069735100"],
     )
     country_hint: str | None = Field(
         default=None,
         description="ISO-3166 alpha-2 country code hint.",
-        example="US",
+        examples=["US"],
         alias="phone.country_hint",
     )
     name_hint: str | None = Field(
@@ -28,7 +30,5 @@ class CallerIDRequest(BaseModel):
         alias="phone.postal_code_hint",
     )
 
-    class Config:
-        """Pydantic config."""
-        populate_by_name = True
-        allow_population_by_field_name = True
+    # Not used on the request path, so build the schema only on first use
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
@@ -1,24 +1,29 @@
 """Caller Identification API client for Trestle integration."""
 
+from __future__ import annotations
+
 import logging
-from datetime import datetime, timezone
-from typing import Any
+import re
+from collections.abc import Sequence
 
 import httpx
-from tenacity import (
-    before_sleep_log,
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from pydantic import TypeAdapter
 
 from ...models.caller_id import CallerIDResponse
-from ._requests import CallerIDRequest
+from .._common import (
+    BATCH_CONCURRENCY,
+    CACHE_MAX_SIZE,
+    CACHE_TTL,
+    MAX_RETRIES,
+    ErrorTypes,
+    ResponseCache,
+    call_with_retries,
+    gather_bounded,
+    raise_for_status,
+)
 from ._exceptions import (
     APIError,
     AuthenticationError,
-    CallerIDAPIError,
     InvalidPhoneNumberError,
     RateLimitExceededError,
     ServerError,
@@ -27,49 +32,96 @@ from ._exceptions import (
 
 logger = logging.getLogger(__name__)
 
-# Configure retry settings
-RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
-MAX_RETRIES = 3
-MIN_RETRY_DELAY = 1  # seconds
-MAX_RETRY_DELAY = 10  # seconds
+_REQUEST_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
 
+# Built once at import so each response reuses the same validator
+_CALLER_RESPONSE_ADAPTER = TypeAdapter(CallerIDResponse)
+
+_ERRORS = ErrorTypes(
+    invalid=InvalidPhoneNumberError,
+    invalid_message="Invalid phone number",
+    authentication=AuthenticationError,
+    rate_limit=RateLimitExceededError,
+    server=ServerError,
+    api=APIError,
+)
 
-def _should_retry_error(exception: Exception) -> bool:
-    """Determine if the request should be retried based on the exception."""
-    if isinstance(exception, (RateLimitExceededError, ServerError)):
-        return True
-    if isinstance(exception, APIError) and exception.status_code in RETRY_STATUS_CODES:
-        return True
-    if isinstance(exception, (httpx.RequestError, httpx.HTTPStatusError)):
-        return True
-    return False
+# Query parameter names, in the order of lookup_caller's arguments
+_CALLER_PARAM_ALIASES = (
+    "phone",
+    "phone.country_hint",
+    "phone.name_hint",
+    "phone.postal_code_hint",
+)
+_PHONE_DIGIT_RE = re.compile(r"\d")
+
+
+def _build_caller_params(
+    phone: str,
+    country_hint: str | None,
+    name_hint: str | None,
+    postal_code_hint: str | None,
+) -> dict[str, str]:
+    """Build the alias-keyed query parameters, dropping unset values.
+
+    Mirrors ``CallerIDRequest.dict(exclude_none=True, by_alias=True)`` without
+    constructing and validating a model on every call.
+    """
+    if not _PHONE_DIGIT_RE.search(phone):
+        raise InvalidPhoneNumberError("Invalid phone number: no digits found")
+    values = (phone, country_hint, name_hint, postal_code_hint)
+    return {
+        alias: value
+        for alias, value in zip(_CALLER_PARAM_ALIASES, values)
+        if value is not None
+    }
 
 
 class CallerIDAPI:
-    """Client for the Trestle Caller Identification API."""
-
-    def __init__(self, client: httpx.AsyncClient, base_url: str, api_key: str) -> None:
+    """Client for the Trestle Caller Identification API.
+
+    The client is expected to be shared across calls so connections are kept
+    alive between lookups, e.g.::
+
+        httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            http2=True,  # requires the ``h2`` package
+        )
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        base_url: str,
+        api_key: str,
+        cache_max_size: int = CACHE_MAX_SIZE,
+        cache_ttl: float = CACHE_TTL,
+        max_retries: int = MAX_RETRIES,
+    ) -> None:
         """Initialize the CallerIDAPI client.
 
         Args:
             client: HTTPX async client instance.
             base_url: Base URL for the Trestle API.
             api_key: Trestle API key.
+            cache_max_size: Maximum number of cached responses (0 disables caching).
+            cache_ttl: Seconds a cached response stays valid.
+            max_retries: Total attempts per lookup, including the first.
         """
         self._client = client
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
-        self._endpoint = f"{self._base_url}/3.1/caller_id"
-
-    @retry(
-        stop=stop_after_attempt(MAX_RETRIES),
-        wait=wait_exponential(
-            multiplier=1, min=MIN_RETRY_DELAY, max=MAX_RETRY_DELAY
-        ),
-        retry=retry_if_exception_type(_should_retry_error),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
+        self._headers = {"x-api-key": api_key}
+        self._max_retries = max_retries
+        self._timeout = _REQUEST_TIMEOUT
+        self._cache: ResponseCache[CallerIDResponse] = ResponseCache(cache_max_size, cache_ttl)
+        self._endpoint = httpx.URL(f"{self._base_url}/3.1/caller_id")
+
     async def lookup_caller(
         self,
         phone: str,
@@ -79,6 +131,9 @@ class CallerIDAPI:
     ) -> CallerIDResponse:
         """Look up caller information by phone number.
 
+        Successful responses are cached per identical set of arguments, and
+        concurrent identical lookups share a single request.
+
         Args:
             phone: The phone number to look up (E.164 or local format).
             country_hint: ISO-3166 alpha-2 country code hint.
@@ -96,59 +151,66 @@ class CallerIDAPI:
             APIError: For other API errors.
             ValidationError: If request validation fails.
         """
-        try:
-            # Validate and prepare the request
-            request_data = CallerIDRequest(
-                phone=phone,
-                country_hint=country_hint,
-                name_hint=name_hint,
-                postal_code_hint=postal_code_hint,
-            )
+        params = _build_caller_params(
+            phone, country_hint, name_hint, postal_code_hint
+        )
+
+        return await self._cache.get_or_fetch(
+            tuple(params.items()),
+            lambda: call_with_retries(
+                lambda: self._get_caller(params),
+                _ERRORS,
+                "lookup_caller",
+                max_attempts=self._max_retries,
+            ),
+        )
+
+    async def lookup_callers(
+        self,
+        phones: Sequence[str],
+        country_hint: str | None = None,
+        *,
+        concurrency: int = BATCH_CONCURRENCY,
+    ) -> list[CallerIDResponse | Exception]:
+        """Look up several phone numbers concurrently.
+
+        Args:
+            phones: The phone numbers to look up.
+            country_hint: ISO-3166 alpha-2 country code hint applied to every number.
+            concurrency: Maximum number of lookups in flight at once.
 
+        Returns:
+            One entry per phone number, in order: the CallerIDResponse, or the
+            exception ``lookup_caller`` raised for that number.
+        """
+        return await gather_bounded(
+            (lambda phone=phone: self.lookup_caller(phone, country_hint) for phone in phones),
+            concurrency,
+        )
+
+    async def _get_caller(self, params: dict[str, str]) -> CallerIDResponse:
+        """Issue a single request and map the response to a model or exception."""
+        try:
             # Make the API request
             response = await self._client.get(
                 self._endpoint,
-                params=request_data.dict(exclude_none=True, by_alias=True),
-                headers={"x-api-key": self._api_key},
-                timeout=30.0,
+                params=params,
+                headers=self._headers,
+                timeout=self._timeout,
             )
 
             # Handle error responses
-            if response.status_code == 400:
-                error_data = response.json()
-                raise InvalidPhoneNumberError(
-                    f"Invalid phone number: {error_data.get('message', 'Unknown error')}",
-                    error_data,
-                )
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid API key")
-            if response.status_code == 403:
-                raise AuthenticationError("Forbidden - check API key permissions")
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", "60"))
-                raise RateLimitExceededError(retry_after=retry_after)
-            if response.status_code >= 500:
-                raise ServerError("Server error occurred")
-            if not response.is_success:
-                error_data = response.json()
-                raise APIError(
-                    f"API error: {error_data.get('message', 'Unknown error')}",
-                    status_code=response.status_code,
-                    details=error_data,
-                )
+            raise_for_status(response, _ERRORS)
 
             # Parse and return the successful response
-            return CallerIDResponse(**response.json())
+            return _CALLER_RESPONSE_ADAPTER.validate_json(response.content)
 
-        except httpx.RequestError as e:
-            logger.error(f"Request failed: {str(e)}")
-            raise APIError(f"Request failed: {str(e)}", status_code=0) from e
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {str(e)}")
+            logger.error("HTTP error: %s", e)
             raise APIError(
                 f"HTTP error: {str(e)}",
                 status_code=e.response.status_code if e.response else 0,
             ) from e
         except ValueError as e:
-            logger.error(f"Invalid response data: {str(e)}")
+            logger.error("Invalid response data: %s", e)
             raise ValidationError(f"Invalid response data: {str(e)}") from e
@@ -1,6 +1,8 @@
 """Request models for the Find Person API."""
 
-from pydantic import BaseModel, Field, HttpUrl
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AddressSearch(BaseModel):
@@ -42,6 +44,8 @@ class AddressSearch(BaseModel):
         description="ISO-3166 alpha-2 country code"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class FindPersonRequest(AddressSearch):
     """Request model for the Find Person API.
@@ -55,10 +59,11 @@ class FindPersonRequest(AddressSearch):
         description="Name of the person to search for"
     )
 
-    class Config:
-        """Pydantic config."""
-        allow_population_by_field_name = True
-        schema_extra = {
+    # Not used on the request path, so build the schema only on first use
+    model_config = ConfigDict(
+        populate_by_name=True,
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "name": "John Smith",
                 "address.street_line_1": "100 Syrws St",
@@ -68,4 +73,5 @@ class FindPersonRequest(AddressSearch):
                 "address.state_code": "WA",
                 "address.country_code": "US"
             }
-        }
+        },
+    )
@@ -1,8 +1,12 @@
 """Response models for the Find Person API."""
 
+from __future__ import annotations
+
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field
+
+from ...models._common import PartialError
 
 
 class Address(BaseModel):
@@ -44,6 +48,8 @@ class Address(BaseModel):
         description="End date of residence (YYYY-MM-DD) if not current"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PhoneNumber(BaseModel):
     """Phone number information for a person."""
@@ -60,6 +66,8 @@ class PhoneNumber(BaseModel):
         description="Whether this is a current phone number"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class EmailAddress(BaseModel):
     """Email address information for a person."""
@@ -76,6 +84,8 @@ class EmailAddress(BaseModel):
         description="Whether this is a current email address"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class Person(BaseModel):
     """Information about a found person."""
@@ -136,11 +146,7 @@ class Person(BaseModel):
         description="Twitter handle if available"
     )
 
-
-class PartialError(BaseModel):
-    """Model for partial error responses."""
-    name: str | None = None
-    message: str | None = None
+    model_config = ConfigDict(defer_build=True)
 
 
 class FindPersonResponse(BaseModel):
@@ -162,12 +168,9 @@ class FindPersonResponse(BaseModel):
         description="Warnings returned as part of the response, if applicable"
     )
 
-    class Config:
-        """Pydantic config."""
-        json_encoders = {
-            dict: lambda v: v if v is not None else {}
-        }
-        schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "count_person": 1,
                 "person": [
@@ -201,7 +204,7 @@ class FindPersonResponse(BaseModel):
                                 "type": "personal",
                                 "is_current": True
                             }
- ]
+                        ]
                     }
                 ],
                 "error": {
@@ -210,4 +213,5 @@ class FindPersonResponse(BaseModel):
                 },
                 "warnings": ["Missing Input"]
             }
-        }
+        },
+    )
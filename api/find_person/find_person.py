@@ -1,19 +1,25 @@
 """Find Person API client for Trestle integration."""
 
+from __future__ import annotations
+
 import logging
-from typing import Any
+from collections.abc import Mapping, Sequence
 
 import httpx
-from tenacity import (
-    before_sleep_log,
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from pydantic import TypeAdapter
 
 from ...models.find_person import FindPersonResponse
-from ._requests import FindPersonRequest
+from .._common import (
+    BATCH_CONCURRENCY,
+    CACHE_MAX_SIZE,
+    CACHE_TTL,
+    MAX_RETRIES,
+    ErrorTypes,
+    ResponseCache,
+    call_with_retries,
+    gather_bounded,
+    raise_for_status,
+)
 from ._exceptions import (
     APIError,
     AuthenticationError,
@@ -25,49 +31,108 @@ from ._exceptions import (
 
 logger = logging.getLogger(__name__)
 
-# Configure retry settings
-RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
-MAX_RETRIES = 3
-MIN_RETRY_DELAY = 1  # seconds
-MAX_RETRY_DELAY = 10  # seconds
+_REQUEST_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
 
+# Built once at import so each response reuses the same validator
+_PERSON_RESPONSE_ADAPTER = TypeAdapter(FindPersonResponse)
 
-def _should_retry_error(exception: Exception) -> bool:
-    """Determine if the request should be retried based on the exception."""
-    if isinstance(exception, (RateLimitExceededError, ServerError)):
-        return True
-    if isinstance(exception, APIError) and exception.status_code in RETRY_STATUS_CODES:
-        return True
-    if isinstance(exception, (httpx.RequestError, httpx.HTTPStatusError)):
-        return True
-    return False
+_ERRORS = ErrorTypes(
+    invalid=InvalidSearchCriteriaError,
+    invalid_message="Invalid search criteria",
+    authentication=AuthenticationError,
+    rate_limit=RateLimitExceededError,
+    server=ServerError,
+    api=APIError,
+    invalid_detail="Insufficient or invalid search parameters",
+)
 
+# Query parameter names, in the order of find_person's arguments
+_PERSON_PARAM_ALIASES = (
+    "name",
+    "address.street_line_1",
+    "address.street_line_2",
+    "address.city",
+    "address.postal_code",
+    "address.state_code",
+    "address.country_code",
+)
 
-class FindPersonAPI:
-    """Client for the Trestle Find Person API."""
 
-    def __init__(self, client: httpx.AsyncClient, base_url: str, api_key: str) -> None:
+def _build_person_params(
+    name: str,
+    street_line_1: str | None,
+    street_line_2: str | None,
+    city: str | None,
+    postal_code: str | None,
+    state_code: str | None,
+    country_code: str | None,
+) -> dict[str, str]:
+    """Build the alias-keyed query parameters, dropping unset values.
+
+    Mirrors ``FindPersonRequest.dict(exclude_none=True, by_alias=True)`` without
+    constructing and validating a model on every call.
+    """
+    values = (
+        name,
+        street_line_1,
+        street_line_2,
+        city,
+        postal_code,
+        state_code,
+        country_code,
+    )
+    return {
+        alias: value
+        for alias, value in zip(_PERSON_PARAM_ALIASES, values)
+        if value is not None
+    }
+
+
+class FindPersonAPI:
+    """Client for the Trestle Find Person API.
+
+    The client is expected to be shared across calls so connections are kept
+    alive between lookups, e.g.::
+
+        httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            http2=True,  # requires the ``h2`` package
+        )
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        base_url: str,
+        api_key: str,
+        cache_max_size: int = CACHE_MAX_SIZE,
+        cache_ttl: float = CACHE_TTL,
+        max_retries: int = MAX_RETRIES,
+    ) -> None:
         """Initialize the FindPersonAPI client.
 
         Args:
             client: HTTPX async client instance.
             base_url: Base URL for the Trestle API.
             api_key: Trestle API key.
+            cache_max_size: Maximum number of cached responses (0 disables caching).
+            cache_ttl: Seconds a cached response stays valid.
+            max_retries: Total attempts per lookup, including the first.
         """
         self._client = client
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
-        self._endpoint = f"{self._base_url}/3.1/person"
-
-    @retry(
-        stop=stop_after_attempt(MAX_RETRIES),
-        wait=wait_exponential(
-            multiplier=1, min=MIN_RETRY_DELAY, max=MAX_RETRY_DELAY
-        ),
-        retry=retry_if_exception_type(_should_retry_error),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
+        self._headers = {"x-api-key": api_key}
+        self._max_retries = max_retries
+        self._timeout = _REQUEST_TIMEOUT
+        self._cache: ResponseCache[FindPersonResponse] = ResponseCache(cache_max_size, cache_ttl)
+        self._endpoint = httpx.URL(f"{self._base_url}/3.1/person")
+
     async def find_person(
         self,
         name: str,
@@ -80,6 +145,9 @@ class FindPersonAPI:
     ) -> FindPersonResponse:
         """Find a person by name and optional address information.
 
+        Successful responses are cached per identical set of arguments, and
+        concurrent identical lookups share a single request.
+
         At least one of the address fields should be provided along with the name
         to narrow down the search results.
 
@@ -103,62 +171,70 @@ class FindPersonAPI:
             APIError: For other API errors.
             ValidationError: If request validation fails.
         """
-        try:
-            # Validate and prepare the request
-            request_data = FindPersonRequest(
-                name=name,
-                street_line_1=street_line_1,
-                street_line_2=street_line_2,
-                city=city,
-                postal_code=postal_code,
-                state_code=state_code,
-                country_code=country_code,
-            )
+        params = _build_person_params(
+            name,
+            street_line_1,
+            street_line_2,
+            city,
+            postal_code,
+            state_code,
+            country_code,
+        )
+
+        return await self._cache.get_or_fetch(
+            tuple(params.items()),
+            lambda: call_with_retries(
+                lambda: self._get_person(params),
+                _ERRORS,
+                "find_person",
+                max_attempts=self._max_retries,
+            ),
+        )
+
+    async def find_people(
+        self,
+        searches: Sequence[Mapping[str, str | None]],
+        *,
+        concurrency: int = BATCH_CONCURRENCY,
+    ) -> list[FindPersonResponse | Exception]:
+        """Run several person searches concurrently.
 
+        Args:
+            searches: Keyword arguments for ``find_person``, one mapping per search.
+            concurrency: Maximum number of searches in flight at once.
+
+        Returns:
+            One entry per search, in order: the FindPersonResponse, or the
+            exception ``find_person`` raised for that search.
+        """
+        return await gather_bounded(
+            (lambda search=search: self.find_person(**search) for search in searches),
+            concurrency,
+        )
+
+    async def _get_person(self, params: dict[str, str]) -> FindPersonResponse:
+        """Issue a single request and map the response to a model or exception."""
+        try:
             # Make the API request
             response = await self._client.get(
                 self._endpoint,
-                params=request_data.dict(exclude_none=True, by_alias=True),
-                headers={"x-api-key": self._api_key},
-                timeout=30.0,
+                params=params,
+                headers=self._headers,
+                timeout=self._timeout,
             )
 
             # Handle error responses
-            if response.status_code == 400:
-                error_data = response.json()
-                raise InvalidSearchCriteriaError(
-                    f"Invalid search criteria: {error_data.get('message', 'Insufficient or invalid search parameters')}",
-                    error_data,
-                )
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid API key")
-            if response.status_code == 403:
-                raise AuthenticationError("Forbidden - check API key permissions")
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", "60"))
-                raise RateLimitExceededError(retry_after=retry_after)
-            if response.status_code >= 500:
-                raise ServerError("Server error occurred")
-            if not response.is_success:
-                error_data = response.json()
-                raise APIError(
-                    f"API error: {error_data.get('message', 'Unknown error')}",
-                    status_code=response.status_code,
-                    details=error_data,
-                )
+            raise_for_status(response, _ERRORS)
 
             # Parse and return the successful response
-            return FindPersonResponse(**response.json())
+            return _PERSON_RESPONSE_ADAPTER.validate_json(response.content)
 
-        except httpx.RequestError as e:
-            logger.error(f"Request failed: {str(e)}")
-            raise APIError(f"Request failed: {str(e)}", status_code=0) from e
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {str(e)}")
+            logger.error("HTTP error: %s", e)
             raise APIError(
                 f"HTTP error: {str(e)}",
                 status_code=e.response.status_code if e.response else 0,
             ) from e
         except ValueError as e:
-            logger.error(f"Invalid response data: {str(e)}")
+            logger.error("Invalid response data: %s", e)
             raise ValidationError(f"Invalid response data: {str(e)}") from e
@@ -1,6 +1,10 @@
 """Exceptions for the Phone Feedback API."""
 
-from trestle.exceptions import TrestleAPIError
+from __future__ import annotations
+
+from typing import Any
+
+from ...exceptions import TrestleAPIError
 
 
 class PhoneFeedbackAPIError(TrestleAPIError):
@@ -15,7 +19,15 @@ class PhoneFeedbackValidationError(PhoneFeedbackAPIError):
 
 class PhoneFeedbackRateLimitError(PhoneFeedbackAPIError):
     """Raised when rate limit is exceeded for phone feedback API."""
-    pass
+    def __init__(
+        self,
+        message: str,
+        *,
+        retry_after: float | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.retry_after = retry_after
+        super().__init__(message, **kwargs)
 
 
 class PhoneFeedbackAuthenticationError(PhoneFeedbackAPIError):
@@ -1,9 +1,12 @@
 """Request models for the Phone Feedback API."""
 from __future__ import annotations
 
+import re
 from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+_NON_DIGIT_RE = re.compile(r"\D+")
 
 
 class PhoneFeedbackRequest(BaseModel):
@@ -29,12 +32,16 @@ class PhoneFeedbackRequest(BaseModel):
         description="Whether the phone number belongs to the correct party.",
     )
 
+    model_config = ConfigDict(defer_build=True)
+
     @field_validator("phone")
     @classmethod
     def validate_phone(cls, v: str) -> str:
         """Validate phone number format."""
+        if v.isdigit():
+            return v
         # Remove all non-digit characters
-        digits = "".join(filter(str.isdigit, v))
+        digits = _NON_DIGIT_RE.sub("", v)
         if not digits:
             raise ValueError("Phone number must contain digits")
         return digits
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PhoneFeedbackError(BaseModel):
@@ -12,6 +12,8 @@ class PhoneFeedbackError(BaseModel):
     name: str = Field(..., description="The type of error that occurred.")
     message: str = Field(..., description="A human-readable error message.")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PhoneFeedbackResponse(BaseModel):
     """Response model for phone feedback submission.
@@ -26,3 +28,5 @@ class PhoneFeedbackResponse(BaseModel):
         None,
         description="Error details if the request encountered a partial error.",
     )
+
+    model_config = ConfigDict(defer_build=True)
@@ -5,11 +5,13 @@ which allows submitting feedback about phone number status and right party conta
 """
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
 import httpx
+from pydantic import TypeAdapter
 
-from ...client import TrestleAPIClient
+from .._common import retry_after_from_headers
 from ._exceptions import (
     PhoneFeedbackAPIError,
     PhoneFeedbackAuthenticationError,
@@ -19,10 +21,54 @@ from ._exceptions import (
 from ._requests import PhoneFeedbackRequest
 from ._responses import PhoneFeedbackResponse
 
+if TYPE_CHECKING:
+    # The client module imports this one, so only import it for annotations
+    from ...client import TrestleAPIClient
+
+_FEEDBACK_RESPONSE_ADAPTER = TypeAdapter(PhoneFeedbackResponse)
+
+_AUTHENTICATION_MESSAGE = "Authentication failed. Please check your API key."
+_RATE_LIMIT_MESSAGE = "Rate limit exceeded. Please try again later."
+
+
+def _validation_error(response: httpx.Response) -> PhoneFeedbackAPIError:
+    return PhoneFeedbackValidationError(
+        f"Validation error: {response.text}",
+        status_code=400,
+        response=response,
+    )
+
+
+def _authentication_error(response: httpx.Response) -> PhoneFeedbackAPIError:
+    return PhoneFeedbackAuthenticationError(
+        _AUTHENTICATION_MESSAGE,
+        status_code=403,
+        response=response,
+    )
+
+
+def _rate_limit_error(response: httpx.Response) -> PhoneFeedbackAPIError:
+    return PhoneFeedbackRateLimitError(
+        _RATE_LIMIT_MESSAGE,
+        status_code=429,
+        response=response,
+        retry_after=retry_after_from_headers(response.headers),
+    )
+
+
+# Exception factories for the status codes with a dedicated error type
+_STATUS_ERRORS: dict[int, Callable[[httpx.Response], PhoneFeedbackAPIError]] = {
+    400: _validation_error,
+    403: _authentication_error,
+    429: _rate_limit_error,
+}
+
 
 class PhoneFeedbackAPI:
     """Client for the Trestle Phone Feedback API.
 
+    Requests go through the parent ``TrestleAPIClient``'s pooled connection.
+
     Example:
         ```python
         async with TrestleAPIClient() as client:
@@ -46,6 +92,7 @@ class PhoneFeedbackAPI:
         """
         self._client = client
         self._base_url = f"{client._config.base_url.rstrip('/')}/1.0"
+        self._url = httpx.URL(f"{self._base_url}/phone_feedback")
 
     async def submit_feedback(
         self,
@@ -67,42 +114,26 @@ class PhoneFeedbackAPI:
             PhoneFeedbackRateLimitError: If rate limit is exceeded.
             PhoneFeedbackAPIError: For other API errors.
         """
-        url = f"{self._base_url}/phone_feedback"
-
         try:
+            # Serialize with pydantic-core rather than dumping to a dict for httpx
+            headers = {"content-type": "application/json", **kwargs.pop("headers", {})}
             response = await self._client._request(
                 "POST",
-                url,
-                json=feedback.model_dump(exclude_unset=True),
+                self._url,
+                content=feedback.model_dump_json(exclude_unset=True),
+                headers=headers,
                 **kwargs,
             )
 
-            return PhoneFeedbackResponse.model_validate(response)
+            return _FEEDBACK_RESPONSE_ADAPTER.validate_json(response.content)
 
         except httpx.HTTPStatusError as e:
             if e.response is None:
                 raise PhoneFeedbackAPIError("No response received from server") from e
 
-            if e.response.status_code == 400:
-                raise PhoneFeedbackValidationError(
-                    f"Validation error: {e.response.text}",
-                    status_code=400,
-                    response=e.response,
-                ) from e
-            if e.response.status_code == 403:
-                raise PhoneFeedbackAuthenticationError(
-                    "Authentication failed. Please check your API key.",
-                    status_code=403,
-                    response=e.response,
-                ) from e
-            if e.response.status_code == 429:
-                retry_after = int(e.response.headers.get("Retry-After", 60))
-                raise PhoneFeedbackRateLimitError(
-                    "Rate limit exceeded. Please try again later.",
-                    status_code=429,
-                    response=e.response,
-                    retry_after=retry_after,
-                ) from e
+            handler = _STATUS_ERRORS.get(e.response.status_code)
+            if handler is not None:
+                raise handler(e.response) from e
 
             raise PhoneFeedbackAPIError(
                 f"API request failed with status {e.response.status_code}: {e.response.text}",
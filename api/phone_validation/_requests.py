@@ -1,6 +1,6 @@
 """Request models for the Phone Validation API."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PhoneValidationRequest(BaseModel):
@@ -22,13 +22,13 @@ class PhoneValidationRequest(BaseModel):
         description="Optional add-ons like 'litigator_checks'"
     )
 
-    class Config:
-        """Pydantic config."""
-        allow_population_by_field_name = True
-        schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "phone": "2069735100",
                 "phone.country_hint": "US",
                 "add_ons": "litigator_checks"
             }
-        }
+        },
+    )
@@ -1,9 +1,21 @@
 """Request models for the Real Contact API."""
 
+import re
 from enum import Enum
+from ipaddress import IPv4Address
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    field_validator,
+    model_serializer,
+)
+
+_NON_DIGIT_RE = re.compile(r"\D+")
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
 
 class AddOns(str, Enum):
@@ -81,8 +93,10 @@ class RealContactRequest(BaseModel):
     @classmethod
     def validate_phone(cls, v: str) -> str:
         """Validate and clean phone number."""
+        if v.isdigit():
+            return v
         # Remove all non-digit characters
-        cleaned = "".join(c for c in v if c.isdigit())
+        cleaned = _NON_DIGIT_RE.sub("", v)
         if not cleaned:
             raise ValueError("Phone number must contain at least one digit")
         return cleaned
@@ -93,7 +107,7 @@ class RealContactRequest(BaseModel):
         """Basic email validation."""
         if v is None:
             return None
-        if "@" not in v or "." not in v.partition("@")[2]:
+        if not _EMAIL_RE.match(v):
             raise ValueError("Invalid email format")
         return v.lower()
 
@@ -103,39 +117,43 @@ class RealContactRequest(BaseModel):
         """Basic IP address validation."""
         if v is None:
             return None
-        parts = v.split(".")
-        if len(parts) != 4:
-            raise ValueError("Invalid IP address format (expected IPv4)")
-        for part in parts:
-            try:
-                num = int(part)
-                if not 0 <= num <= 255:
-                    raise ValueError("IP octet out of range")
-            except ValueError as e:
-                raise ValueError("IP address must contain numbers") from e
+        try:
+            IPv4Address(v)
+        except ValueError as e:
+            raise ValueError("Invalid IP address format (expected IPv4)") from e
         return v
 
-    def model_dump(self, **kwargs) -> dict[str, Any]:
-        """Override model_dump to handle nested models and aliases."""
-        data = super().model_dump(
-            by_alias=True,
-            exclude_none=True,
-            **kwargs,
-        )
-        
-        # Handle nested address and business models
-        if self.address:
-            address_data = self.address.model_dump(by_alias=True, exclude_none=True)
-            data.update(address_data)
-            data.pop("address", None)
-            
-        if self.business:
-            business_data = self.business.model_dump(by_alias=True, exclude_none=True)
-            data.update(business_data)
-            data.pop("business", None)
-        
-        # Convert add_ons to comma-separated string
-        if "add_ons" in data and data["add_ons"] is not None:
-            data["add_ons"] = ",".join(add_on.value for add_on in data["add_ons"])
-            
+    @model_serializer(mode="wrap")
+    def _flatten(
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ) -> dict[str, Any]:
+        """Flatten nested address and business fields into query parameter keys.
+
+        Runs after the regular serialization, so ``include``, ``exclude`` and
+        ``mode`` apply as usual and ``model_dump`` and ``model_dump_json``
+        agree. Nested fields are always keyed as ``"address.city"`` etc., even
+        when not dumping by alias, and add-ons are joined into a
+        comma-separated string.
+        """
+        data = handler(self)
+        for nested in ("address", "business"):
+            values = data.pop(nested, None)
+            if values:
+                for key, value in values.items():
+                    data[key if info.by_alias else f"{nested}.{key}"] = value
+        if data.get("add_ons") is not None:
+            # AddOns members are str, and plain strings in JSON mode
+            data["add_ons"] = ",".join(data["add_ons"])
         return data
+
+    def model_dump(
+        self, *, by_alias: bool = True, exclude_none: bool = True, **kwargs: Any
+    ) -> dict[str, Any]:
+        """Dump the request as alias-keyed query parameters, dropping ``None`` values."""
+        return super().model_dump(by_alias=by_alias, exclude_none=exclude_none, **kwargs)
+
+    def model_dump_json(
+        self, *, by_alias: bool = True, exclude_none: bool = True, **kwargs: Any
+    ) -> str:
+        """Dump the request as JSON with the same keys as ``model_dump``."""
+        return super().model_dump_json(by_alias=by_alias, exclude_none=exclude_none, **kwargs)
@@ -1,8 +1,45 @@
 """Response models for the Real Contact API."""
 
-from typing import Any, Literal
+import sys
+from functools import cache
+from typing import Any, TypeVar
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from ...models._common import ContactGrade, LineType, PartialError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Flat response keys for each nested model, interned once at import
+_PHONE_KEYS = tuple(map(sys.intern, (
+    "phone.is_valid",
+    "phone.activity_score",
+    "phone.line_type",
+    "phone.name_match",
+    "phone.contact_grade",
+)))
+_EMAIL_KEYS = tuple(map(sys.intern, (
+    "email.is_valid",
+    "email.name_match",
+    "email.contact_grade",
+    "email.deliverability",
+    "email.age_score",
+)))
+_ADDRESS_KEYS = tuple(map(sys.intern, ("address.is_valid", "address.name_match")))
+
+
+@cache
+def _alias_to_name(model: type[BaseModel]) -> dict[str, str]:
+    """Map each field's alias (or name, if it has none) to its field name."""
+    return {field.alias or name: name for name, field in model.model_fields.items()}
+
+
+def _build(model: type[ModelT], values: dict[str, Any], validate: bool) -> ModelT:
+    """Build ``model`` from alias-keyed ``values``, validating only when asked."""
+    if validate:
+        return model.model_validate(values)
+    names = _alias_to_name(model)
+    return model.model_construct(**{names.get(key, key): value for key, value in values.items()})
 
 
 class PhoneInfo(BaseModel):
@@ -19,16 +56,7 @@ class PhoneInfo(BaseModel):
         ge=0,
         le=100,
     )
-    line_type: Literal[
-        "Landline",
-        "Premium",
-        "NonFixedVOIP",
-        "Mobile",
-        "FixedVOIP",
-        "TollFree",
-        "Other",
-        "Voicemail",
-    ] | None = Field(
+    line_type: LineType | None = Field(
         default=None,
         alias="phone.line_type",
         description="The line type of the phone number.",
@@ -38,12 +66,14 @@ class PhoneInfo(BaseModel):
         alias="phone.name_match",
         description="A match/no match indicator for the name associated with the phone.",
     )
-    contact_grade: Literal["A", "B", "C", "D", "F"] | None = Field(
+    contact_grade: ContactGrade | None = Field(
         default=None,
         alias="phone.contact_grade",
         description="An A–F grade determining the quality of the lead's phone.",
     )
 
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
 
 class EmailInfo(BaseModel):
     """Email information from Real Contact API response."""
@@ -57,7 +87,7 @@ class EmailInfo(BaseModel):
         alias="email.name_match",
         description="A match/no match indicator for the name associated with the email.",
     )
-    contact_grade: Literal["A", "B", "C", "D", "F"] | None = Field(
+    contact_grade: ContactGrade | None = Field(
         default=None,
         alias="email.contact_grade",
         description="An A–F grade determining the quality of the lead's email.",
@@ -75,6 +105,8 @@ class EmailInfo(BaseModel):
         le=100,
     )
 
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
 
 class AddressInfo(BaseModel):
     """Address information from Real Contact API response."""
@@ -89,6 +121,8 @@ class AddressInfo(BaseModel):
         description="A match/no match indicator for the name associated with the address.",
     )
 
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
 
 class LitigatorChecks(BaseModel):
     """Litigator checks information (if add-on enabled)."""
@@ -105,17 +139,15 @@ class LitigatorChecks(BaseModel):
         le=100,
     )
 
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
 
 class AddOnsResponse(BaseModel):
     """Add-ons response data."""
     litigator_checks: LitigatorChecks | None = None
     email_checks: dict[str, Any] | None = None
 
-
-class PartialError(BaseModel):
-    """Partial error response model."""
-    name: str | None = None
-    message: str | None = None
+    model_config = ConfigDict(frozen=True)
 
 
 class RealContactResponse(BaseModel):
@@ -127,8 +159,8 @@ class RealContactResponse(BaseModel):
     error: PartialError | None = None
     warnings: list[str] | None = None
 
-    @classmethod
     @field_validator("warnings", mode="before")
+    @classmethod
     def validate_warnings(cls, v: Any) -> list[str] | None:
         """Convert single warning string to list if needed."""
         if v is None:
@@ -140,32 +172,21 @@ class RealContactResponse(BaseModel):
         return None
 
     @classmethod
-    def from_api_response(cls, data: dict[str, Any]) -> "RealContactResponse":
+    def from_api_response(
+        cls, data: dict[str, Any], validate: bool = False
+    ) -> "RealContactResponse":
         """Create a RealContactResponse from the raw API response.
 
         This handles the flat structure of the API response and maps it to our nested model.
+
+        The models are built with ``model_construct`` by default, skipping
+        validation of values copied straight from the response. Pass
+        ``validate=True`` to validate every field instead.
         """
         # Extract base fields
-        phone = {
-            "phone.is_valid": data.get("phone.is_valid"),
-            "phone.activity_score": data.get("phone.activity_score"),
-            "phone.line_type": data.get("phone.line_type"),
-            "phone.name_match": data.get("phone.name_match"),
-            "phone.contact_grade": data.get("phone.contact_grade"),
-        }
-
-        email = {
-            "email.is_valid": data.get("email.is_valid"),
-            "email.name_match": data.get("email.name_match"),
-            "email.contact_grade": data.get("email.contact_grade"),
-            "email.deliverability": data.get("email.deliverability"),
-            "email.age_score": data.get("email.age_score"),
-        }
-        
-        address = {
-            "address.is_valid": data.get("address.is_valid"),
-            "address.name_match": data.get("address.name_match"),
-        }
+        phone = {key: data.get(key) for key in _PHONE_KEYS}
+        email = {key: data.get(key) for key in _EMAIL_KEYS}
+        address = {key: data.get(key) for key in _ADDRESS_KEYS}
         
         # Handle add-ons if present
         add_ons = data.get("add_ons", {})
@@ -174,21 +195,23 @@ class RealContactResponse(BaseModel):
             "litigator_checks.risk_score": add_ons.get("litigator_checks", {}).get("risk_score"),
         } if add_ons and "litigator_checks" in add_ons else None
         
-        return cls(
-            phone=PhoneInfo.model_validate(phone),
-            email=EmailInfo.model_validate(email),
-            address=AddressInfo.model_validate(address),
-            add_ons=AddOnsResponse(
-                litigator_checks=LitigatorChecks.model_validate(litigator_checks) if litigator_checks else None,
-                email_checks=add_ons.get("email_checks"),
-            ) if add_ons else None,
-            error=PartialError(**data["error"]) if "error" in data and data["error"] else None,
-            warnings=data.get("warnings"),
-        )
-
-    class Config:
-        """Pydantic config."""
-        json_encoders = {
-            dict: lambda v: v if v is not None else {}
-        }
-        populate_by_name = True
+        error = data.get("error")
+
+        # model_construct skips the warnings validator, so normalize here
+        warnings = data.get("warnings")
+        if not validate:
+            warnings = cls.validate_warnings(warnings)
+
+        return _build(cls, {
+            "phone": _build(PhoneInfo, phone, validate),
+            "email": _build(EmailInfo, email, validate),
+            "address": _build(AddressInfo, address, validate),
+            "add_ons": _build(AddOnsResponse, {
+                "litigator_checks": _build(LitigatorChecks, litigator_checks, validate) if litigator_checks else None,
+                "email_checks": add_ons.get("email_checks"),
+            }, validate) if add_ons else None,
+            "error": _build(PartialError, error, validate) if error else None,
+            "warnings": warnings,
+        }, validate)
+
+    model_config = ConfigDict(populate_by_name=True)
@@ -1,17 +1,28 @@
 """Real Contact API client for Trestle integration."""
 
 import logging
+from collections.abc import Mapping, Sequence
+from typing import Any
 
 import httpx
-from tenacity import (
-    before_sleep_log,
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from pydantic_core import from_json
 
 from ...models.real_contact import RealContactResponse
+from .._common import (
+    BATCH_CONCURRENCY,
+    CACHE_MAX_SIZE,
+    CACHE_TTL,
+    MAX_RETRIES,
+    AIMDLimiter,
+    ErrorTypes,
+    ResponseCache,
+    call_with_retries,
+    gather_bounded,
+    rate_limit_tracker,
+    raise_for_status,
+    wait_decorrelated_jitter,
+    wait_retry_after,
+)
 from ._exceptions import (
     APIError,
     AuthenticationError,
@@ -24,49 +35,136 @@ from ._requests import AddOns, RealContactRequest
 
 logger = logging.getLogger(__name__)
 
+_REQUEST_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+_ERRORS = ErrorTypes(
+    invalid=InvalidSearchCriteriaError,
+    invalid_message="Invalid search criteria",
+    authentication=AuthenticationError,
+    rate_limit=RateLimitExceededError,
+    server=ServerError,
+    api=APIError,
+    invalid_detail="Insufficient or invalid parameters",
+)
+
 # Configure retry settings
-RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
-MAX_RETRIES = 3
-MIN_RETRY_DELAY = 1  # seconds
+MIN_RETRY_DELAY = 0.1  # seconds
 MAX_RETRY_DELAY = 10  # seconds
+_RETRY_WAIT = wait_retry_after(wait_decorrelated_jitter(MIN_RETRY_DELAY, MAX_RETRY_DELAY))
 
 
-def _should_retry_error(exception: Exception) -> bool:
-    """Determine if the request should be retried based on the exception."""
-    if isinstance(exception, RateLimitExceededError | ServerError):
-        return True
-    if isinstance(exception, APIError) and exception.status_code in RETRY_STATUS_CODES:
-        return True
-    if isinstance(exception, httpx.RequestError | httpx.HTTPStatusError):
-        return True
-    return False
+# Query parameter names, in the order of verify_contact's arguments
+_CONTACT_PARAM_ALIASES = ("name", "phone", "email", "ip_address")
+_ADDRESS_PARAM_ALIASES = (
+    "address.street_line_1",
+    "address.city",
+    "address.postal_code",
+    "address.state_code",
+    "address.country_code",
+)
+
+
+def _build_contact_params(
+    name: str,
+    phone: str,
+    email: str | None,
+    ip_address: str | None,
+    street_line_1: str | None,
+    city: str | None,
+    postal_code: str | None,
+    state_code: str | None,
+    country_code: str,
+    business_name: str | None,
+    add_ons: tuple[AddOns, ...],
+) -> dict[str, str]:
+    """Build the alias-keyed query parameters, dropping unset values.
+
+    Produces the parameters ``RealContactRequest.model_dump()`` flattens to and
+    runs the same phone, email and IP address validators, without constructing
+    a model on every call.
+    """
+    values = (
+        name,
+        RealContactRequest.validate_phone(phone),
+        RealContactRequest.validate_email(email),
+        RealContactRequest.validate_ip_address(ip_address),
+    )
+    params = {
+        alias: value
+        for alias, value in zip(_CONTACT_PARAM_ALIASES, values)
+        if value is not None
+    }
+    if street_line_1 or city or postal_code or state_code:
+        address = (street_line_1, city, postal_code, state_code, country_code)
+        for alias, value in zip(_ADDRESS_PARAM_ALIASES, address):
+            if value is not None:
+                params[alias] = value
+    if business_name:
+        params["business.name"] = business_name
+    if add_ons:
+        params["add_ons"] = ",".join(add_ons)
+    return params
 
 
 class RealContactAPI:
-    """Client for the Trestle Real Contact API."""
+    """Client for the Trestle Real Contact API.
+
+    ``client`` should be one long-lived client shared across calls, such as
+    one created by ``make_trestle_client``. With HTTP/2 enabled (requires the
+    ``h2`` package), concurrent lookups are multiplexed over one connection
+    instead of each opening its own, e.g.::
 
-    def __init__(self, client: httpx.AsyncClient, base_url: str, api_key: str) -> None:
+        httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            http2=True,
+        )
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        base_url: str,
+        api_key: str,
+        cache_max_size: int = CACHE_MAX_SIZE,
+        cache_ttl: float = CACHE_TTL,
+        cache: ResponseCache[RealContactResponse] | None = None,
+        limiter: AIMDLimiter | None = None,
+        max_retries: int = MAX_RETRIES,
+        validate_responses: bool = True,
+    ) -> None:
         """Initialize the RealContactAPI client.
 
         Args:
             client: HTTPX async client instance.
             base_url: Base URL for the Trestle API.
             api_key: Trestle API key.
+            cache_max_size: Maximum number of cached responses (0 disables caching).
+            cache_ttl: Seconds a cached response stays valid.
+            cache: Optional cache to use instead of a private one, e.g. to
+                share responses between several clients. Overrides
+                ``cache_max_size`` and ``cache_ttl``.
+            limiter: Optional concurrency limiter to use instead of a private
+                one, e.g. to share one budget between clients on the same key.
+            max_retries: Total attempts per lookup, including the first.
+            validate_responses: Validate every response field. Pass ``False``
+                to build trusted responses without validation, which is
+                faster but lets out-of-range or unexpected values through.
         """
         self._client = client
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
-        self._endpoint = f"{self._base_url}/1.1/real_contact"
-
-    @retry(
-        stop=stop_after_attempt(MAX_RETRIES),
-        wait=wait_exponential(
-            multiplier=1, min=MIN_RETRY_DELAY, max=MAX_RETRY_DELAY
-        ),
-        retry=retry_if_exception_type(_should_retry_error),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
+        self._headers = {"x-api-key": api_key}
+        self._max_retries = max_retries
+        self._validate_responses = validate_responses
+        self._timeout = _REQUEST_TIMEOUT
+        self._endpoint = httpx.URL(f"{self._base_url}/1.1/real_contact")
+        self._cache: ResponseCache[RealContactResponse] = cache or ResponseCache(
+            cache_max_size, cache_ttl, throttle_error=RateLimitExceededError
+        )
+        self._limiter = limiter or AIMDLimiter()
+        self._rate_limit = rate_limit_tracker(self._base_url, api_key)
+
     async def verify_contact(
         self,
         name: str,
@@ -85,6 +183,11 @@ class RealContactAPI:
     ) -> RealContactResponse:
         """Verify contact information and get quality scores.
 
+        Successful responses are cached per identical set of request
+        parameters. After a rate-limited lookup, the same parameters raise
+        RateLimitExceededError again without a request until the server's
+        Retry-After has passed.
+
         Args:
             name: The name of the person to verify.
             phone: The phone number to verify.
@@ -113,75 +216,94 @@ class RealContactAPI:
         """
         try:
             # Prepare add-ons
-            add_ons = []
-            if enable_email_deliverability:
-                add_ons.append(AddOns.EMAIL_CHECKS_DELIVERABILITY)
-            if enable_email_age:
-                add_ons.append(AddOns.EMAIL_CHECKS_AGE)
-            if enable_litigator_checks:
-                add_ons.append(AddOns.LITIGATOR_CHECKS)
-
-            # Create request model
-            request_data = RealContactRequest(
-                name=name,
-                phone=phone,
-                email=email,
-                ip_address=ip_address,
-                address={
-                    "street_line_1": street_line_1,
-                    "city": city,
-                    "postal_code": postal_code,
-                    "state_code": state_code,
-                    "country_code": country_code,
-                } if any([street_line_1, city, postal_code, state_code]) else None,
-                business={"name": business_name} if business_name else None,
-                add_ons=add_ons if add_ons else None,
+            add_ons = tuple(
+                add_on
+                for add_on, enabled in (
+                    (AddOns.EMAIL_CHECKS_DELIVERABILITY, enable_email_deliverability),
+                    (AddOns.EMAIL_CHECKS_AGE, enable_email_age),
+                    (AddOns.LITIGATOR_CHECKS, enable_litigator_checks),
+                )
+                if enabled
             )
 
-            # Make the API request
-            response = await self._client.get(
-                self._endpoint,
-                params=request_data.model_dump(),
-                headers={"x-api-key": self._api_key},
-                timeout=30.0,
+            params = _build_contact_params(
+                name,
+                phone,
+                email,
+                ip_address,
+                street_line_1,
+                city,
+                postal_code,
+                state_code,
+                country_code,
+                business_name,
+                add_ons,
             )
+        except ValueError as e:
+            logger.error("Invalid request data: %s", e)
+            raise ValidationError(f"Invalid request data: {str(e)}") from e
 
-            # Handle error responses
-            response_data = response.json()
+        return await self._cache.get_or_fetch(
+            tuple(params.items()),
+            lambda: call_with_retries(
+                lambda: self._verify_contact(params),
+                _ERRORS,
+                "verify_contact",
+                _RETRY_WAIT,
+                max_attempts=self._max_retries,
+            ),
+        )
 
-            if response.status_code == 400:
-                raise InvalidSearchCriteriaError(
-                    f"Invalid search criteria: {response_data.get('message', 'Insufficient or invalid parameters')}",
-                    response_data,
-                )
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid API key")
-            if response.status_code == 403:
-                raise AuthenticationError("Forbidden - check API key permissions")
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", "60"))
-                raise RateLimitExceededError(retry_after=retry_after)
-            if response.status_code >= 500:
-                raise ServerError("Server error occurred")
-            if not response.is_success:
-                raise APIError(
-                    f"API error: {response_data.get('message', 'Unknown error')}",
-                    status_code=response.status_code,
-                    details=response_data,
+    async def verify_contacts(
+        self,
+        contacts: Sequence[Mapping[str, Any]],
+        *,
+        concurrency: int = BATCH_CONCURRENCY,
+    ) -> list[RealContactResponse | Exception]:
+        """Verify several contacts concurrently.
+
+        Args:
+            contacts: Keyword arguments for ``verify_contact``, one mapping per contact.
+            concurrency: Maximum number of verifications in flight at once.
+
+        Returns:
+            One entry per contact, in order: the RealContactResponse, or the
+            exception ``verify_contact`` raised for that contact.
+        """
+        return await gather_bounded(
+            (lambda contact=contact: self.verify_contact(**contact) for contact in contacts),
+            concurrency,
+        )
+
+    async def _verify_contact(self, params: dict[str, Any]) -> RealContactResponse:
+        """Issue the verification request and map the response to a model or exception."""
+        try:
+            # Make the API request
+            await self._rate_limit.wait()
+            response = await self._limiter.run(
+                lambda: self._client.get(
+                    self._endpoint,
+                    params=params,
+                    headers=self._headers,
+                    timeout=self._timeout,
                 )
+            )
+            self._rate_limit.update(response.headers)
+
+            # Handle error responses
+            raise_for_status(response, _ERRORS)
 
             # Parse and return the successful response
-            return RealContactResponse.from_api_response(response_data)
+            return RealContactResponse.from_api_response(
+                from_json(response.content), validate=self._validate_responses
+            )
 
-        except httpx.RequestError as e:
-            logger.error(f"Request failed: {str(e)}")
-            raise APIError(f"Request failed: {str(e)}", status_code=0) from e
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {str(e)}")
+            logger.error("HTTP error: %s", e)
             raise APIError(
                 f"HTTP error: {str(e)}",
                 status_code=e.response.status_code if e.response else 0,
             ) from e
         except ValueError as e:
-            logger.error(f"Invalid response data: {str(e)}")
+            logger.error("Invalid response data: %s", e)
             raise ValidationError(f"Invalid response data: {str(e)}") from e
@@ -1,6 +1,6 @@
 """Request models for the Reverse Address API."""
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 
 class ReverseAddressRequest(BaseModel):
@@ -45,10 +45,10 @@ class ReverseAddressRequest(BaseModel):
         description="ISO-3166 alpha-2 country code"
     )
 
-    class Config:
-        """Pydantic config."""
-        allow_population_by_field_name = True
-        schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "street_line_1": "100 Syrws St",
                 "street_line_2": "Ste 1",
@@ -57,4 +57,5 @@ class ReverseAddressRequest(BaseModel):
                 "state_code": "WA",
                 "country_code": "US"
             }
-        }
+        },
+    )
@@ -1,19 +1,28 @@
 """Reverse Address API client for Trestle integration."""
 
 import logging
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 import httpx
-from tenacity import (
-    before_sleep_log,
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from pydantic import TypeAdapter
 
 from ...models.reverse_address import ReverseAddressResponse
-from ._requests import ReverseAddressRequest
+from .._common import (
+    BATCH_CONCURRENCY,
+    CACHE_MAX_SIZE,
+    CACHE_TTL,
+    MAX_RETRIES,
+    AIMDLimiter,
+    ErrorTypes,
+    ResponseCache,
+    call_with_retries,
+    gather_bounded,
+    rate_limit_tracker,
+    raise_for_status,
+    wait_decorrelated_jitter,
+    wait_retry_after,
+)
 from ._exceptions import (
     APIError,
     AuthenticationError,
@@ -25,49 +34,112 @@ from ._exceptions import (
 
 logger = logging.getLogger(__name__)
 
+_REQUEST_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+_ERRORS = ErrorTypes(
+    invalid=InvalidAddressError,
+    invalid_message="Invalid address",
+    authentication=AuthenticationError,
+    rate_limit=RateLimitExceededError,
+    server=ServerError,
+    api=APIError,
+)
+
+# Built once at import so each response reuses the same validator
+_ADDRESS_RESPONSE_ADAPTER = TypeAdapter(ReverseAddressResponse)
+
 # Configure retry settings
-RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
-MAX_RETRIES = 3
-MIN_RETRY_DELAY = 1  # seconds
+MIN_RETRY_DELAY = 0.1  # seconds
 MAX_RETRY_DELAY = 10  # seconds
+_RETRY_WAIT = wait_retry_after(wait_decorrelated_jitter(MIN_RETRY_DELAY, MAX_RETRY_DELAY))
+
+
+# Query parameter names, in the order of lookup_address's arguments
+_ADDRESS_PARAM_ALIASES = (
+    "street_line_1",
+    "city",
+    "postal_code",
+    "state_code",
+    "street_line_2",
+    "country_code",
+)
+
 
+def _build_address_params(
+    street_line_1: str,
+    city: str,
+    postal_code: str,
+    state_code: str,
+    street_line_2: str | None,
+    country_code: str,
+) -> dict[str, str]:
+    """Build the query parameters, dropping unset values.
 
-def _should_retry_error(exception: Exception) -> bool:
-    """Determine if the request should be retried based on the exception."""
-    if isinstance(exception, (RateLimitExceededError, ServerError)):
-        return True
-    if isinstance(exception, APIError) and exception.status_code in RETRY_STATUS_CODES:
-        return True
-    if isinstance(exception, (httpx.RequestError, httpx.HTTPStatusError)):
-        return True
-    return False
+    Mirrors ``ReverseAddressRequest.dict(exclude_none=True, by_alias=True)``
+    without constructing and validating a model on every call.
+    """
+    values = (street_line_1, city, postal_code, state_code, street_line_2, country_code)
+    return {
+        alias: value
+        for alias, value in zip(_ADDRESS_PARAM_ALIASES, values)
+        if value is not None
+    }
 
 
 class ReverseAddressAPI:
-    """Client for the Trestle Reverse Address API."""
+    """Client for the Trestle Reverse Address API.
+
+    ``client`` should be one long-lived client shared across calls, such as
+    one created by ``make_trestle_client``. With HTTP/2 enabled (requires the
+    ``h2`` package), concurrent lookups are multiplexed over one connection
+    instead of each opening its own, e.g.::
+
+        httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            http2=True,
+        )
+    """
 
-    def __init__(self, client: httpx.AsyncClient, base_url: str, api_key: str) -> None:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        base_url: str,
+        api_key: str,
+        cache_max_size: int = CACHE_MAX_SIZE,
+        cache_ttl: float = CACHE_TTL,
+        cache: ResponseCache[ReverseAddressResponse] | None = None,
+        limiter: AIMDLimiter | None = None,
+        max_retries: int = MAX_RETRIES,
+    ) -> None:
         """Initialize the ReverseAddressAPI client.
 
         Args:
             client: HTTPX async client instance.
             base_url: Base URL for the Trestle API.
             api_key: Trestle API key.
+            cache_max_size: Maximum number of cached responses (0 disables caching).
+            cache_ttl: Seconds a cached response stays valid.
+            cache: Optional cache to use instead of a private one, e.g. to
+                share responses between several clients. Overrides
+                ``cache_max_size`` and ``cache_ttl``.
+            limiter: Optional concurrency limiter to use instead of a private
+                one, e.g. to share one budget between clients on the same key.
+            max_retries: Total attempts per lookup, including the first.
         """
         self._client = client
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
-        self._endpoint = f"{self._base_url}/3.1/location"
-
-    @retry(
-        stop=stop_after_attempt(MAX_RETRIES),
-        wait=wait_exponential(
-            multiplier=1, min=MIN_RETRY_DELAY, max=MAX_RETRY_DELAY
-        ),
-        retry=retry_if_exception_type(_should_retry_error),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
+        self._headers = {"x-api-key": api_key}
+        self._max_retries = max_retries
+        self._timeout = _REQUEST_TIMEOUT
+        self._endpoint = httpx.URL(f"{self._base_url}/3.1/location")
+        self._cache: ResponseCache[ReverseAddressResponse] = cache or ResponseCache(
+            cache_max_size, cache_ttl, throttle_error=RateLimitExceededError
+        )
+        self._limiter = limiter or AIMDLimiter()
+        self._rate_limit = rate_limit_tracker(self._base_url, api_key)
+
     async def lookup_address(
         self,
         street_line_1: str,
@@ -79,6 +151,10 @@ class ReverseAddressAPI:
     ) -> ReverseAddressResponse:
         """Look up address information.
 
+        Successful responses are cached per identical set of arguments. After
+        a rate-limited lookup, the same arguments raise RateLimitExceededError
+        again without a request until the server's Retry-After has passed.
+
         Args:
             street_line_1: First line of the street address
             city: City name
@@ -98,61 +174,80 @@ class ReverseAddressAPI:
             APIError: For other API errors.
             ValidationError: If request validation fails.
         """
+        return await self._cache.get_or_fetch(
+            (street_line_1, city, postal_code, state_code, street_line_2, country_code),
+            lambda: call_with_retries(
+                lambda: self._lookup_address(
+                    street_line_1, city, postal_code, state_code, street_line_2, country_code
+                ),
+                _ERRORS,
+                "lookup_address",
+                _RETRY_WAIT,
+                max_attempts=self._max_retries,
+            ),
+        )
+
+    async def lookup_addresses(
+        self,
+        addresses: Sequence[Mapping[str, str | None]],
+        *,
+        concurrency: int = BATCH_CONCURRENCY,
+    ) -> list[ReverseAddressResponse | Exception]:
+        """Look up several addresses concurrently.
+
+        Args:
+            addresses: Keyword arguments for ``lookup_address``, one mapping per address.
+            concurrency: Maximum number of lookups in flight at once.
+
+        Returns:
+            One entry per address, in order: the ReverseAddressResponse, or the
+            exception ``lookup_address`` raised for that address.
+        """
+        return await gather_bounded(
+            (lambda address=address: self.lookup_address(**address) for address in addresses),
+            concurrency,
+        )
+
+    async def _lookup_address(
+        self,
+        street_line_1: str,
+        city: str,
+        postal_code: str,
+        state_code: str,
+        street_line_2: str | None,
+        country_code: str,
+    ) -> ReverseAddressResponse:
+        """Issue the lookup request and map the response to a model or exception."""
         try:
-            # Validate and prepare the request
-            request_data = ReverseAddressRequest(
-                street_line_1=street_line_1,
-                street_line_2=street_line_2,
-                city=city,
-                postal_code=postal_code,
-                state_code=state_code,
-                country_code=country_code,
+            # Prepare the query parameters
+            params = _build_address_params(
+                street_line_1, city, postal_code, state_code, street_line_2, country_code
             )
 
             # Make the API request
-            response = await self._client.get(
-                self._endpoint,
-                params=request_data.dict(exclude_none=True, by_alias=True),
-                headers={"x-api-key": self._api_key},
-                timeout=30.0,
+            await self._rate_limit.wait()
+            response = await self._limiter.run(
+                lambda: self._client.get(
+                    self._endpoint,
+                    params=params,
+                    headers=self._headers,
+                    timeout=self._timeout,
+                )
             )
+            self._rate_limit.update(response.headers)
 
             # Handle error responses
-            if response.status_code == 400:
-                error_data = response.json()
-                raise InvalidAddressError(
-                    f"Invalid address: {error_data.get('message', 'Unknown error')}",
-                    error_data,
-                )
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid API key")
-            if response.status_code == 403:
-                raise AuthenticationError("Forbidden - check API key permissions")
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", "60"))
-                raise RateLimitExceededError(retry_after=retry_after)
-            if response.status_code >= 500:
-                raise ServerError("Server error occurred")
-            if not response.is_success:
-                error_data = response.json()
-                raise APIError(
-                    f"API error: {error_data.get('message', 'Unknown error')}",
-                    status_code=response.status_code,
-                    details=error_data,
-                )
+            raise_for_status(response, _ERRORS)
 
             # Parse and return the successful response
-            return ReverseAddressResponse(**response.json())
+            return _ADDRESS_RESPONSE_ADAPTER.validate_json(response.content)
 
-        except httpx.RequestError as e:
-            logger.error(f"Request failed: {str(e)}")
-            raise APIError(f"Request failed: {str(e)}", status_code=0) from e
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {str(e)}")
+            logger.error("HTTP error: %s", e)
             raise APIError(
                 f"HTTP error: {str(e)}",
                 status_code=e.response.status_code if e.response else 0,
             ) from e
         except ValueError as e:
-            logger.error(f"Invalid response data: {str(e)}")
+            logger.error("Invalid response data: %s", e)
             raise ValidationError(f"Invalid response data: {str(e)}") from e
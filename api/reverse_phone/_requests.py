@@ -1,7 +1,7 @@
 """Request models for the Reverse Phone API."""
 
 from typing import Optional
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ReversePhoneRequest(BaseModel):
@@ -30,8 +30,4 @@ class ReversePhoneRequest(BaseModel):
         alias="phone.postal_code_hint"
     )
 
-    class Config:
-        allow_population_by_field_name = True
-        json_encoders = {
-            HttpUrl: lambda v: str(v) if v else None
-        }
+    model_config = ConfigDict(populate_by_name=True)
@@ -1,19 +1,25 @@
 """Reverse Phone API client for Trestle integration."""
 
 import logging
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Union
+from typing import Optional
 
 import httpx
-from tenacity import (
-    before_sleep_log,
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from pydantic import TypeAdapter
 
+from ...exceptions import TrestleAPIError
 from ...models.reverse_phone import ReversePhoneResponse
+from .._common import (
+    CACHE_MAX_SIZE,
+    CACHE_TTL,
+    MAX_RETRIES,
+    ErrorTypes,
+    ResponseCache,
+    call_with_retries,
+    is_valid_phone,
+    raise_for_status,
+    wait_exponential_jitter,
+    wait_retry_after,
+)
 from ._exceptions import (
     APIError,
     AuthenticationError,
@@ -23,16 +29,31 @@ from ._exceptions import (
     ServerError,
     ValidationError,
 )
-from ._requests import ReversePhoneRequest
-from ._responses import ReversePhoneResponse as ResponseModel
 
 logger = logging.getLogger(__name__)
 
-# Default timeout for API requests (in seconds)
-DEFAULT_TIMEOUT = 30.0
+# Built once at import so each response reuses the same validator
+_PHONE_RESPONSE_ADAPTER = TypeAdapter(ReversePhoneResponse)
 
-# Base URL for the Trestle API
-BASE_URL = "https://api.trestleiq.com/3.2"
+_ERRORS = ErrorTypes(
+    invalid=InvalidPhoneNumberError,
+    invalid_message="Invalid phone number",
+    authentication=AuthenticationError,
+    rate_limit=RateLimitExceededError,
+    server=ServerError,
+    api=APIError,
+)
+
+# Query parameter names, in the order of lookup_phone's arguments
+_PHONE_PARAM_ALIASES = (
+    "phone",
+    "phone.country_hint",
+    "phone.name_hint",
+    "phone.postal_code_hint",
+)
+
+# Sleep as long as the server asks; otherwise back off exponentially with jitter
+_RETRY_WAIT = wait_retry_after(wait_exponential_jitter())
 
 
 class ReversePhoneAPI:
@@ -40,82 +61,35 @@ class ReversePhoneAPI:
     
     This client provides methods to look up phone number information using the Trestle API.
     It includes retry logic, error handling, and request/response validation.
-    
-    Args:
-        api_key: Your Trestle API key
-        base_url: Base URL for the Trestle API (defaults to production)
-        timeout: Request timeout in seconds (default: 30.0)
-        max_retries: Maximum number of retry attempts (default: 3)
+    Requests go through the shared, pooled client passed in by ``TrestleAPIClient``.
     """
     
     def __init__(
         self,
+        client: httpx.AsyncClient,
+        base_url: str,
         api_key: str,
-        base_url: str = BASE_URL,
-        timeout: float = DEFAULT_TIMEOUT,
-        max_retries: int = 3,
-    ):
+        cache_max_size: int = CACHE_MAX_SIZE,
+        cache_ttl: float = CACHE_TTL,
+        max_retries: int = MAX_RETRIES,
+    ) -> None:
+        """Initialize the ReversePhoneAPI client.
+
+        Args:
+            client: HTTPX async client instance.
+            base_url: Base URL for the Trestle API.
+            api_key: Trestle API key.
+            cache_max_size: Maximum number of cached responses (0 disables caching).
+            cache_ttl: Seconds a cached response stays valid.
+            max_retries: Total attempts per lookup, including the first.
+        """
+        self._client = client
+        self._base_url = base_url.rstrip("/")
         self.api_key = api_key
-        self.base_url = base_url.rstrip("/")
-        self.timeout = timeout
-        self.max_retries = max_retries
-        
-        # Configure the HTTP client with retry logic
-        self._client = self._get_http_client()
-    
-    def _get_http_client(self) -> httpx.AsyncClient:
-        """Create and configure the HTTP client with retry logic."""
-        # Define which exceptions should trigger a retry
-        retry_exceptions = (
-            httpx.NetworkError,
-            httpx.TimeoutException,
-            httpx.HTTPStatusError,
-            ServerError,
-            RateLimitExceededError,
-        )
-        
-        # Configure retry decorator
-        retry_decorator = retry(
-            stop=stop_after_attempt(self.max_retries),
-            wait=wait_exponential(multiplier=1, min=4, max=10),
-            retry=retry_if_exception_type(retry_exceptions),
-            before_sleep=before_sleep_log(logger, logging.WARNING),
-            reraise=True,
-        )
-        
-        # Create client with retry logic
-        transport = httpx.AsyncHTTPTransport(
-            retries=self.max_retries,
-            http2=True,
-        )
-        
-        client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=self.timeout,
-            transport=transport,
-            headers={
-                "x-api-key": self.api_key,
-                "User-Agent": "LeadIgnite/1.0",
-                "Accept": "application/json",
-            },
-        )
-        
-        # Apply retry decorator to the request method
-        client.send = retry_decorator(client.send)
-        
-        return client
-    
-    async def close(self) -> None:
-        """Close the HTTP client and release resources."""
-        await self._client.aclose()
-    
-    async def __aenter__(self):
-        """Support async context manager."""
-        return self
-    
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Ensure resources are cleaned up when exiting context."""
-        await self.close()
+        self._headers = {"x-api-key": api_key}
+        self._max_retries = max_retries
+        self._cache: ResponseCache[ReversePhoneResponse] = ResponseCache(cache_max_size, cache_ttl)
+        self._endpoint = httpx.URL(f"{self._base_url}/3.2/phone")
     
     async def lookup_phone(
         self,
@@ -126,6 +100,9 @@ class ReversePhoneAPI:
     ) -> ReversePhoneResponse:
         """Look up information about a phone number.
         
+        Successful responses are cached per identical set of arguments, and
+        concurrent identical lookups share a single request.
+        
         Args:
             phone: The phone number to look up (E.164 or local format)
             country_hint: ISO-3166 alpha-2 country code hint
@@ -143,67 +120,51 @@ class ReversePhoneAPI:
             APIError: For other API errors
             ValidationError: If request validation fails
         """
-        # Validate request
-        request_data = ReversePhoneRequest(
-            phone=phone,
-            country_hint=country_hint,
-            name_hint=name_hint,
-            postal_code_hint=postal_code_hint,
-        )
-        
-        # Prepare query parameters
-        params = {"phone": request_data.phone}
-        if request_data.country_hint:
-            params["phone.country_hint"] = request_data.country_hint
-        if request_data.name_hint:
-            params["phone.name_hint"] = request_data.name_hint
-        if request_data.postal_code_hint:
-            params["phone.postal_code_hint"] = request_data.postal_code_hint
+        # Reject malformed numbers locally instead of spending a request on them
+        if not is_valid_phone(phone):
+            raise InvalidPhoneNumberError("Invalid phone number")
+
+        # Build the alias-keyed parameters directly rather than through a model
+        values = (phone, country_hint, name_hint, postal_code_hint)
+        params = {
+            alias: value
+            for alias, value in zip(_PHONE_PARAM_ALIASES, values)
+            if value is not None
+        }
         
+        try:
+            return await self._cache.get_or_fetch(
+                tuple(params.items()),
+                lambda: call_with_retries(
+                    lambda: self._get_phone(params),
+                    _ERRORS,
+                    "lookup_phone",
+                    _RETRY_WAIT,
+                    max_attempts=self._max_retries,
+                ),
+            )
+        except TrestleAPIError:
+            raise
+        except Exception as e:
+            logger.error("Unexpected error: %s", e, exc_info=True)
+            raise ReversePhoneAPIError(f"Unexpected error: {str(e)}") from e
+
+    async def _get_phone(self, params: dict[str, str]) -> ReversePhoneResponse:
+        """Issue a single request and map the response to a model or exception."""
         try:
             # Make the API request
             response = await self._client.get(
-                "/phone",
+                self._endpoint,
                 params=params,
-                headers={"x-api-key": self.api_key},
+                headers=self._headers,
             )
-            
-            # Handle different status codes
-            if response.status_code == 200:
-                return ResponseModel(**response.json())
-            elif response.status_code == 400:
-                raise InvalidPhoneNumberError("Invalid phone number")
-            elif response.status_code == 401:
-                raise AuthenticationError("Invalid API key")
-            elif response.status_code == 403:
-                error_data = response.json()
-                raise AuthenticationError(
-                    error_data.get("message", "Forbidden"),
-                    details=error_data,
-                )
-            elif response.status_code == 429:
-                retry_after = response.headers.get("Retry-After")
-                raise RateLimitExceededError(
-                    "Rate limit exceeded",
-                    details={"retry_after": retry_after},
-                )
-            elif 500 <= response.status_code < 600:
-                error_data = response.json()
-                raise ServerError(
-                    error_data.get("message", "Internal server error"),
-                    details=error_data,
-                )
-            else:
-                error_data = response.json()
-                raise APIError(
-                    error_data.get("message", f"Unexpected status code: {response.status_code}"),
-                    status_code=response.status_code,
-                    details=error_data,
-                )
-                
-        except httpx.RequestError as e:
-            logger.error(f"Request failed: {str(e)}")
-            raise ReversePhoneAPIError(f"Request failed: {str(e)}") from e
-        except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}", exc_info=True)
-            raise ReversePhoneAPIError(f"Unexpected error: {str(e)}") from e
+
+            # Handle error responses
+            raise_for_status(response, _ERRORS)
+
+            # Parse and return the successful response
+            return _PHONE_RESPONSE_ADAPTER.validate_json(response.content)
+
+        except ValueError as e:
+            logger.error("Invalid response data: %s", e)
+            raise ValidationError(f"Invalid response data: {str(e)}") from e
@@ -1,6 +1,6 @@
 """Request models for the Smart CNAM API."""
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 
 class SmartCNAMRequest(BaseModel):
@@ -17,12 +17,12 @@ class SmartCNAMRequest(BaseModel):
         description="ISO-3166 alpha-2 country code hint"
     )
 
-    class Config:
-        """Pydantic config."""
-        allow_population_by_field_name = True
-        schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "phone": "2069735100",
                 "phone.country_hint": "US"
             }
-        }
+        },
+    )
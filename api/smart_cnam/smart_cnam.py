@@ -4,16 +4,21 @@ import logging
 from typing import Any
 
 import httpx
-from tenacity import (
-    before_sleep_log,
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from pydantic import TypeAdapter
 
 from ...models.smart_cnam import SmartCNAMResponse
-from ._requests import SmartCNAMRequest
+from .._common import (
+    CACHE_MAX_SIZE,
+    CACHE_TTL,
+    MAX_RETRIES,
+    ErrorTypes,
+    ResponseCache,
+    call_with_retries,
+    is_valid_phone,
+    raise_for_status,
+    wait_exponential_jitter,
+    wait_retry_after,
+)
 from ._exceptions import (
     APIError,
     AuthenticationError,
@@ -26,49 +31,52 @@ from ._exceptions import (
 
 logger = logging.getLogger(__name__)
 
-# Configure retry settings
-RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
-MAX_RETRIES = 3
-MIN_RETRY_DELAY = 1  # seconds
-MAX_RETRY_DELAY = 10  # seconds
+# Built once at import so each response reuses the same validator
+_CNAM_RESPONSE_ADAPTER = TypeAdapter(SmartCNAMResponse)
 
+_ERRORS = ErrorTypes(
+    invalid=InvalidPhoneNumberError,
+    invalid_message="Invalid phone number",
+    authentication=AuthenticationError,
+    rate_limit=RateLimitExceededError,
+    server=ServerError,
+    api=APIError,
+)
 
-def _should_retry_error(exception: Exception) -> bool:
-    """Determine if the request should be retried based on the exception."""
-    if isinstance(exception, (RateLimitExceededError, ServerError)):
-        return True
-    if isinstance(exception, APIError) and exception.status_code in RETRY_STATUS_CODES:
-        return True
-    if isinstance(exception, (httpx.RequestError, httpx.HTTPStatusError)):
-        return True
-    return False
+# Sleep as long as the server asks; otherwise back off exponentially with jitter
+_RETRY_WAIT = wait_retry_after(wait_exponential_jitter())
 
 
 class SmartCNAMAPI:
     """Client for the Trestle Smart CNAM API."""
 
-    def __init__(self, client: httpx.AsyncClient, base_url: str, api_key: str) -> None:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        base_url: str,
+        api_key: str,
+        cache_max_size: int = CACHE_MAX_SIZE,
+        cache_ttl: float = CACHE_TTL,
+        max_retries: int = MAX_RETRIES,
+    ) -> None:
         """Initialize the SmartCNAMAPI client.
 
         Args:
             client: HTTPX async client instance.
             base_url: Base URL for the Trestle API.
             api_key: Trestle API key.
+            cache_max_size: Maximum number of cached responses (0 disables caching).
+            cache_ttl: Seconds a cached response stays valid.
+            max_retries: Total attempts per lookup, including the first.
         """
         self._client = client
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
-        self._endpoint = f"{self._base_url}/3.1/cnam"
-
-    @retry(
-        stop=stop_after_attempt(MAX_RETRIES),
-        wait=wait_exponential(
-            multiplier=1, min=MIN_RETRY_DELAY, max=MAX_RETRY_DELAY
-        ),
-        retry=retry_if_exception_type(_should_retry_error),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
+        self._headers = {"x-api-key": api_key}
+        self._max_retries = max_retries
+        self._cache: ResponseCache[SmartCNAMResponse] = ResponseCache(cache_max_size, cache_ttl)
+        self._endpoint = httpx.URL(f"{self._base_url}/3.1/cnam")
+
     async def lookup_caller(
         self,
         phone: str,
@@ -76,6 +84,9 @@ class SmartCNAMAPI:
     ) -> SmartCNAMResponse:
         """Look up caller information by phone number using Smart CNAM.
 
+        Successful responses are cached per identical set of arguments, and
+        concurrent identical lookups share a single request.
+
         Args:
             phone: The phone number to look up (E.164 or local format).
             country_hint: ISO-3166 alpha-2 country code hint.
@@ -91,57 +102,48 @@ class SmartCNAMAPI:
             APIError: For other API errors.
             ValidationError: If request validation fails.
         """
+        # Reject malformed numbers locally instead of spending a request on them
+        if not is_valid_phone(phone):
+            raise InvalidPhoneNumberError("Invalid phone number")
+
+        # Build the alias-keyed parameters directly rather than through a model
+        params = {"phone": phone}
+        if country_hint is not None:
+            params["phone.country_hint"] = country_hint
+
+        return await self._cache.get_or_fetch(
+            tuple(params.items()),
+            lambda: call_with_retries(
+                lambda: self._lookup_caller(params),
+                _ERRORS,
+                "lookup_caller",
+                _RETRY_WAIT,
+                max_attempts=self._max_retries,
+            ),
+        )
+
+    async def _lookup_caller(self, params: dict[str, str]) -> SmartCNAMResponse:
+        """Issue a single request and map the response to a model or exception."""
         try:
-            # Validate and prepare the request
-            request_data = SmartCNAMRequest(
-                phone=phone,
-                country_hint=country_hint,
-            )
-
             # Make the API request
             response = await self._client.get(
                 self._endpoint,
-                params=request_data.dict(exclude_none=True, by_alias=True),
-                headers={"x-api-key": self._api_key},
-                timeout=30.0,
+                params=params,
+                headers=self._headers,
             )
 
             # Handle error responses
-            if response.status_code == 400:
-                error_data = response.json()
-                raise InvalidPhoneNumberError(
-                    f"Invalid phone number: {error_data.get('message', 'Unknown error')}",
-                    error_data,
-                )
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid API key")
-            if response.status_code == 403:
-                raise AuthenticationError("Forbidden - check API key permissions")
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", "60"))
-                raise RateLimitExceededError(retry_after=retry_after)
-            if response.status_code >= 500:
-                raise ServerError("Server error occurred")
-            if not response.is_success:
-                error_data = response.json()
-                raise APIError(
-                    f"API error: {error_data.get('message', 'Unknown error')}",
-                    status_code=response.status_code,
-                    details=error_data,
-                )
+            raise_for_status(response, _ERRORS)
 
             # Parse and return the successful response
-            return SmartCNAMResponse(**response.json())
+            return _CNAM_RESPONSE_ADAPTER.validate_json(response.content)
 
-        except httpx.RequestError as e:
-            logger.error(f"Request failed: {str(e)}")
-            raise APIError(f"Request failed: {str(e)}", status_code=0) from e
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {str(e)}")
+            logger.error("HTTP error: %s", e)
             raise APIError(
                 f"HTTP error: {str(e)}",
                 status_code=e.response.status_code if e.response else 0,
             ) from e
         except ValueError as e:
-            logger.error(f"Invalid response data: {str(e)}")
+            logger.error("Invalid response data: %s", e)
             raise ValidationError(f"Invalid response data: {str(e)}") from e
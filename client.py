@@ -6,13 +6,18 @@ authentication, request retries, and error handling.
 """
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import logging
+from collections.abc import Awaitable, Callable, Mapping
 from contextlib import asynccontextmanager
+from typing import Any
 
 import httpx
-from pydantic import ConfigDict, Field, field_validator
-from pydantic_settings import BaseSettings
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .api._common import MAX_REQUEST_RATE, TokenBucket
 from .api.caller_identification import CallerIDAPI
 from .api.find_person import FindPersonAPI
 from .api.phone_feedback import PhoneFeedbackAPI
@@ -22,18 +27,98 @@ from .api.reverse_address import ReverseAddressAPI
 from .api.reverse_phone import ReversePhoneAPI
 from .api.smart_cnam import SmartCNAMAPI
 
+# Keep connections alive across lookups so repeated calls skip the TLS handshake
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+
+# HTTP/2 needs the optional h2 package (``pip install "httpx[http2]"``)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+logger = logging.getLogger(__name__)
+
+
+async def _log_http_version(response: httpx.Response) -> None:
+    """Log the negotiated protocol so HTTP/2 use can be confirmed at debug level."""
+    # Runs on every response, so skip the attribute lookups unless debug is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "%s %s used %s", response.request.method, response.url, response.http_version
+        )
+
+
+def make_trestle_client(
+    base_url: str = "",
+    timeout: float = 30.0,
+    http2: bool | None = None,
+    headers: dict[str, str] | None = None,
+    max_rate: float | None = None,
+) -> httpx.AsyncClient:
+    """Create a pooled ``httpx.AsyncClient`` suited to the Trestle API clients.
+
+    The API classes expect one long-lived client shared across calls, so
+    keep-alive connections (and HTTP/2 multiplexing, when available) are
+    reused instead of paying a TCP and TLS handshake per lookup. The
+    negotiated protocol of each response is logged at debug level.
+
+    Args:
+        base_url: Optional base URL for relative request paths.
+        timeout: Request timeout in seconds; connecting is capped at 5 seconds.
+        http2: Enable HTTP/2. Defaults to enabled when ``h2`` is installed.
+        headers: Default headers sent with every request.
+        max_rate: Requests sent per second at most; bursts wait locally
+            instead of hitting the server's rate limit. Unlimited by default.
+
+    Returns:
+        httpx.AsyncClient: The configured client. The caller owns it and must
+        close it with ``aclose()``.
+    """
+    event_hooks: dict[str, list[Callable[..., Awaitable[None]]]] = {
+        "response": [_log_http_version],
+    }
+    if max_rate:
+        bucket = TokenBucket(max_rate)
+
+        async def _admit(request: httpx.Request) -> None:
+            await bucket.acquire()
+
+        event_hooks["request"] = [_admit]
+
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=httpx.Timeout(timeout, connect=5.0),
+        limits=_POOL_LIMITS,
+        http2=_HTTP2_AVAILABLE if http2 is None else http2,
+        headers=headers,
+        event_hooks=event_hooks,
+    )
+
 
 class TrestleConfig(BaseSettings):
-    """Configuration for the Trestle API client."""
+    """Configuration for the Trestle API client.
 
-    api_key: str = Field(..., env="TRESTLE_API_KEY")
-    base_url: str = Field("https://api.trestleiq.com", env="TRESTLE_BASE_URL")
-    timeout: int = Field(30, env="TRESTLE_TIMEOUT")
-    max_retries: int = Field(3, env="TRESTLE_MAX_RETRIES")
+    Values are read from ``TRESTLE_``-prefixed environment variables or a
+    ``.env`` file. The config is frozen, so one instance can be shared safely;
+    use ``model_copy(update=...)`` to derive a modified copy.
+    """
 
-    model_config = ConfigDict(extra="allow")
+    api_key: str
+    base_url: str = "https://api.trestleiq.com"
+    timeout: float = 30.0
+    max_retries: int = 3
+    max_rate: float = MAX_REQUEST_RATE  # requests per second, 0 disables
+
+    model_config = SettingsConfigDict(
+        env_prefix="TRESTLE_",
+        env_file=".env",
+        extra="allow",
+        frozen=True,
+    )
 
     @field_validator("base_url")
+    @classmethod
     def validate_base_url(cls, v: str) -> str:
         """Ensure base URL ends with a slash."""
         return v.rstrip("/") + "/"
@@ -68,23 +153,35 @@ class TrestleAPIClient:
             api_key: Optional API key. Overrides config if provided.
             base_url: Optional base URL. Overrides config if provided.
             timeout: Optional timeout in seconds. Overrides config if provided.
-            max_retries: Optional max retries. Overrides config if provided.
+            max_retries: Optional total attempts per lookup, including the first.
+                Overrides config if provided.
         """
-        self._config = config or TrestleConfig()
-        self._client: httpx.AsyncClient | None = None
         self._logger = logging.getLogger(__name__)
 
         # Override config with explicit parameters if provided
-        if api_key:
-            self._config.api_key = api_key
-        if base_url:
-            self._config.base_url = base_url
-        if timeout is not None:
-            self._config.timeout = timeout
-        if max_retries is not None:
-            self._config.max_retries = max_retries
-
-        # Initialize API clients
+        overrides = {
+            key: value
+            for key, value in (
+                ("api_key", api_key or None),
+                ("base_url", base_url or None),
+                ("timeout", timeout),
+                ("max_retries", max_retries),
+            )
+            if value is not None
+        }
+        if config is None:
+            # Explicit values take precedence over the environment
+            self._config = TrestleConfig(**overrides)
+        else:
+            self._config = config.model_copy(update=overrides) if overrides else config
+
+        # One pooled client built up front, so every sub-API shares its connections
+        self._client = self._make_client()
+        self._warmup_task: asyncio.Task[httpx.Response] | None = None
+        self._reset_apis()
+
+    def _reset_apis(self) -> None:
+        """Drop the cached API clients so they are rebuilt on the current pool."""
         self._reverse_phone: ReversePhoneAPI | None = None
         self._caller_id: CallerIDAPI | None = None
         self._smart_cnam: SmartCNAMAPI | None = None
@@ -102,6 +199,7 @@ class TrestleAPIClient:
                 self._client,
                 self._config.base_url,
                 self._config.api_key,
+                max_retries=self._config.max_retries,
             )
         return self._reverse_phone
 
@@ -113,6 +211,7 @@ class TrestleAPIClient:
                 self._client,
                 self._config.base_url,
                 self._config.api_key,
+                max_retries=self._config.max_retries,
             )
         return self._caller_id
         
@@ -124,6 +223,7 @@ class TrestleAPIClient:
                 self._client,
                 self._config.base_url,
                 self._config.api_key,
+                max_retries=self._config.max_retries,
             )
         return self._smart_cnam
         
@@ -135,6 +235,7 @@ class TrestleAPIClient:
                 client=self._client,
                 base_url=self._config.base_url,
                 api_key=self._config.api_key,
+                max_retries=self._config.max_retries,
             )
         return self._phone_validation
         
@@ -159,6 +260,7 @@ class TrestleAPIClient:
                 client=self._client,
                 base_url=self._config.base_url,
                 api_key=self._config.api_key,
+                max_retries=self._config.max_retries,
             )
         return self._reverse_address
         
@@ -183,6 +285,7 @@ class TrestleAPIClient:
                 client=self._client,
                 base_url=self._config.base_url,
                 api_key=self._config.api_key,
+                max_retries=self._config.max_retries,
             )
         return self._find_person
         
@@ -209,7 +312,12 @@ class TrestleAPIClient:
             ```
         """
         if self._real_contact is None:
-            self._real_contact = RealContactAPI(self)
+            self._real_contact = RealContactAPI(
+                client=self._client,
+                base_url=self._config.base_url,
+                api_key=self._config.api_key,
+                max_retries=self._config.max_retries,
+            )
         return self._real_contact
         
     @property
@@ -236,10 +344,117 @@ class TrestleAPIClient:
             self._phone_feedback = PhoneFeedbackAPI(self)
         return self._phone_feedback
     
+    async def bulk_lookup(
+        self,
+        phone: str,
+        country_hint: str | None = None,
+        address: Mapping[str, str | None] | None = None,
+    ) -> dict[str, Any]:
+        """Run the lookups for a lead concurrently over the shared connection.
+
+        The reverse phone and Smart CNAM lookups for ``phone``, plus a reverse
+        address lookup when ``address`` is given, are awaited together, so the
+        batch takes about as long as its slowest call. A failed lookup is
+        logged and returned in place of its result rather than failing the
+        others.
+
+        Example:
+            ```python
+            async with TrestleAPIClient() as client:
+                results = await client.bulk_lookup(
+                    "2069735100",
+                    address={
+                        "street_line_1": "100 Syrws St",
+                        "city": "Lynden",
+                        "postal_code": "98264",
+                        "state_code": "WA",
+                    },
+                )
+                print(results["smart_cnam"])
+            ```
+
+        Args:
+            phone: The phone number to look up (E.164 or local format).
+            country_hint: ISO-3166 alpha-2 country code hint for the phone lookups.
+            address: Keyword arguments for ``reverse_address.lookup_address``.
+
+        Returns:
+            dict[str, Any]: The result of each lookup, or the exception it
+            raised, keyed by ``"reverse_phone"``, ``"smart_cnam"`` and, when
+            an address is given, ``"reverse_address"``.
+        """
+        # Calls are deferred so a bad argument fails only its own lookup
+        lookups: dict[str, Callable[[], Awaitable[Any]]] = {
+            "reverse_phone": lambda: self.reverse_phone.lookup_phone(phone, country_hint),
+            "smart_cnam": lambda: self.smart_cnam.lookup_caller(phone, country_hint),
+        }
+        if address is not None:
+            lookups["reverse_address"] = lambda: self.reverse_address.lookup_address(**address)
+
+        async def run(call: Callable[[], Awaitable[Any]]) -> Any:
+            return await call()
+
+        results = await asyncio.gather(
+            *(run(call) for call in lookups.values()), return_exceptions=True
+        )
+        for name, result in zip(lookups, results):
+            if isinstance(result, Exception):
+                self._logger.warning("%s lookup failed: %s", name, result)
+        return dict(zip(lookups, results))
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send an authenticated request and raise for unsuccessful statuses.
+
+        The response is returned unparsed so callers can validate the raw
+        body directly, e.g. with ``Model.model_validate_json(response.content)``.
+
+        Args:
+            method: HTTP method.
+            url: Absolute URL or path relative to the configured base URL.
+            **kwargs: Additional arguments to pass to ``httpx.AsyncClient.request``.
+
+        Returns:
+            httpx.Response: The successful response.
+
+        Raises:
+            httpx.HTTPStatusError: If the response status is unsuccessful.
+        """
+        headers = {"x-api-key": self._config.api_key, **kwargs.pop("headers", {})}
+        response = await self._client.request(method, url, headers=headers, **kwargs)
+        response.raise_for_status()
+        return response
+
+    def _make_client(self) -> httpx.AsyncClient:
+        """Create the pooled client shared by all sub-APIs."""
+        return make_trestle_client(
+            self._config.base_url,
+            self._config.timeout,
+            max_rate=self._config.max_rate,
+            headers={
+                "x-api-key": self._config.api_key,
+                "User-Agent": "LeadIgnite/1.0",
+                "Accept": "application/json",
+            },
+        )
+
     async def __aenter__(self):
-        """Support async context manager."""
-        self._client = httpx.AsyncClient(base_url=self._config.base_url, timeout=self._config.timeout)
+        """Support async context manager.
+
+        A ``HEAD /health`` is sent in the background so the first lookup finds
+        an already-negotiated connection in the pool. If the client was closed
+        by an earlier ``async with`` block, a fresh pool is opened first.
+        """
+        if self._client.is_closed:
+            self._client = self._make_client()
+            self._reset_apis()
+        self._warmup_task = asyncio.create_task(self._client.head("/health"))
+        self._warmup_task.add_done_callback(self._log_warmup_failure)
         return self
+
+    def _log_warmup_failure(self, task: asyncio.Task[httpx.Response]) -> None:
+        """Log a failed warm-up request; it only primes the pool, so it is not raised."""
+        if not task.cancelled() and task.exception() is not None:
+            self._logger.debug("Connection warm-up failed: %s", task.exception())
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Clean up resources when exiting the context."""
@@ -247,12 +462,10 @@ class TrestleAPIClient:
     
     async def close(self) -> None:
         """Close the client and release resources."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
-        if self._reverse_phone:
-            await self._reverse_phone.close()
-            self._reverse_phone = None
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            self._warmup_task = None
+        await self._client.aclose()
     
     async def is_healthy(self) -> bool:
         """Check if the Trestle API is healthy.
@@ -260,15 +473,12 @@ class TrestleAPIClient:
         Returns:
             bool: True if the API is healthy, False otherwise.
         """
+        if self._client.is_closed:
+            return False
         try:
-            # Try a simple request to check if the API is responding
-            async with httpx.AsyncClient(base_url=self._config.base_url) as client:
-                response = await client.get(
-                    "/health",
-                    headers={"x-api-key": self._config.api_key},
-                    timeout=5.0,
-                )
-                return response.status_code == 200
+            # Reuse the pooled connection instead of a fresh handshake per check
+            response = await self._client.get("/health", timeout=5.0)
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -293,7 +503,7 @@ async def get_trestle_client(
                 environment variables or .env file.
         base_url: Base URL for the Trestle API. Defaults to production.
         timeout: Request timeout in seconds. Defaults to 30.0.
-        max_retries: Maximum number of retry attempts. Defaults to 3.
+        max_retries: Total attempts per lookup, including the first. Defaults to 3.
         
     Yields:
         TrestleAPIClient: An initialized Trestle API client.
@@ -315,6 +525,7 @@ __all__ = [
     "TrestleAPIClient",
     "TrestleConfig",
     "get_trestle_client",
+    "make_trestle_client",
     # API clients
     "CallerIDAPI",
     "FindPersonAPI",
@@ -0,0 +1,131 @@
+"""Exceptions shared by all Trestle API clients.
+
+Each API package re-exports these from its ``_exceptions`` module and only
+declares its own subclasses for domain-specific errors, such as an invalid
+phone number or address.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+
+
+class TrestleAPIError(Exception):
+    """Base exception for all Trestle API errors."""
+    __slots__ = ("_message", "_detail_default", "details", "status_code", "response")
+
+    def __init__(
+        self,
+        message: str,
+        details: dict[str, Any] | None = None,
+        *,
+        detail_default: str | None = None,
+        status_code: int | None = None,
+        response: httpx.Response | None = None,
+    ) -> None:
+        """Initialize the error.
+
+        Args:
+            message: Error message, or its prefix when ``detail_default`` is set.
+            details: Additional error details, typically the response body.
+            detail_default: When set, ``message`` is suffixed with the
+                ``message`` entry of ``details`` (or this default), formatted
+                only when the message is first read.
+            status_code: HTTP status code of the failed response, if any.
+            response: The failed response, if any.
+        """
+        self._message = message
+        self._detail_default = detail_default
+        self.details = details or {}
+        self.status_code = status_code
+        self.response = response
+        super().__init__(message)
+
+    @property
+    def message(self) -> str:
+        """The full error message."""
+        if self._detail_default is None:
+            return self._message
+        return f"{self._message}: {self.details.get('message', self._detail_default)}"
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class RateLimitExceededError(TrestleAPIError):
+    """Raised when the rate limit is exceeded."""
+    __slots__ = ("retry_after",)
+
+    def __init__(
+        self,
+        retry_after: float | None = None,
+        *,
+        response: httpx.Response | None = None,
+    ) -> None:
+        self.retry_after = retry_after
+        if retry_after is None:
+            message = "Rate limit exceeded. Please try again later."
+        else:
+            message = f"Rate limit exceeded. Please try again in {retry_after:g} seconds."
+        super().__init__(
+            message,
+            {"retry_after": retry_after} if retry_after else {},
+            status_code=429,
+            response=response,
+        )
+
+
+class AuthenticationError(TrestleAPIError):
+    """Raised when authentication fails."""
+    __slots__ = ()
+
+
+class ServerError(TrestleAPIError):
+    """Raised when there's a server-side error (5xx)."""
+    __slots__ = ("retry_after",)
+
+    def __init__(
+        self,
+        message: str,
+        details: dict[str, Any] | None = None,
+        *,
+        retry_after: float | None = None,
+    ) -> None:
+        self.retry_after = retry_after
+        if details is None and retry_after:
+            details = {"retry_after": retry_after}
+        super().__init__(message, details)
+
+
+class APIError(TrestleAPIError):
+    """Generic API error with status code and details."""
+    __slots__ = ()
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int,
+        details: dict[str, Any] | None = None,
+        *,
+        detail_default: str | None = None,
+    ) -> None:
+        super().__init__(
+            message, details, detail_default=detail_default, status_code=status_code
+        )
+
+
+class ValidationError(TrestleAPIError):
+    """Raised when request or response validation fails."""
+    __slots__ = ()
+
+
+__all__ = [
+    "APIError",
+    "AuthenticationError",
+    "RateLimitExceededError",
+    "ServerError",
+    "TrestleAPIError",
+    "ValidationError",
+]
@@ -0,0 +1,73 @@
+"""Pydantic models shared by the Trestle API response models."""
+
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, SkipValidation
+
+
+LineType = Literal[
+    "Landline",
+    "Premium",
+    "NonFixedVOIP",
+    "Mobile",
+    "FixedVOIP",
+    "TollFree",
+    "Other",
+    "Voicemail",
+]
+"""Possible phone line types, validated as a literal string."""
+
+ContactGrade = Literal["A", "B", "C", "D", "F"]
+"""Possible A-F contact quality grades, validated as a literal string."""
+
+# Free-form JSON blobs, kept as decoded instead of walked by the validator
+RawObject = SkipValidation[dict[str, Any] | None]
+RawObjectList = SkipValidation[list[dict[str, Any]] | None]
+
+# Keys only person owners and residents carry, for untagged entries
+_PERSON_KEYS = frozenset((
+    "firstname",
+    "middlename",
+    "lastname",
+    "first_name",
+    "middle_name",
+    "last_name",
+    "age",
+    "age_range",
+    "gender",
+    "relatives",
+    "associates",
+    "education",
+    "employment",
+))
+# Keys only business owners and residents carry; caller ID persons may
+# also carry ``industry``, so person-only keys are checked first
+_BUSINESS_KEYS = frozenset(("industry", "employee_count", "founded", "categories", "website"))
+
+
+def owner_type(value: Any) -> str | None:
+    """Return the ``type`` tag of a person or business owner.
+
+    Used as the discriminator of owner and resident lists, so each entry
+    is validated against one model only. Entries the API sends without a
+    tag are taken as persons if they carry any person-only key, otherwise
+    as businesses if they carry any business-only key. Values that are
+    neither give ``None``, which pydantic reports as a missing tag.
+    """
+    if isinstance(value, dict):
+        tag = value.get("type")
+        if tag is None:
+            if _PERSON_KEYS.isdisjoint(value) and not _BUSINESS_KEYS.isdisjoint(value):
+                tag = "Business"
+            else:
+                tag = "Person"
+        return tag
+    return getattr(value, "type", None)
+
+
+class PartialError(BaseModel):
+    """Model for partial error responses."""
+    name: str | None = None
+    message: str | None = None
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag
 
+from ._common import LineType, PartialError, owner_type
 
-class LineType(str, Enum):
-    """Enumeration of possible phone line types."""
+
+class LineTypeEnum(str, Enum):
+    """Enumeration of possible phone line types.
+
+    ``CallerIDResponse.line_type`` is a plain string; because this is a
+    ``str`` enum its members still compare equal to it.
+    """
     LANDLINE = "Landline"
     PREMIUM = "Premium"
     NON_FIXED_VOIP = "NonFixedVOIP"
@@ -34,6 +40,8 @@ class Address(BaseModel):
     link_to_person_start_date: str | None = None
     link_to_person_end_date: str | None = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PhoneOwnerPerson(BaseModel):
     """Model for a person associated with a phone number."""
@@ -49,6 +57,8 @@ class PhoneOwnerPerson(BaseModel):
     link_to_phone_start_date: str | None = None
     industry: str | None = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PhoneOwnerBusiness(BaseModel):
     """Model for a business associated with a phone number."""
@@ -62,11 +72,14 @@ class PhoneOwnerBusiness(BaseModel):
     type: Literal["Business"] = "Business"
     link_to_phone_start_date: str | None = None
 
+    model_config = ConfigDict(defer_build=True)
 
-class PartialError(BaseModel):
-    """Model for partial error responses."""
-    name: str | None = None
-    message: str | None = None
+
+# Tagged by ``type``; untagged owners are told apart by their keys
+PhoneOwner = Annotated[
+    Annotated[PhoneOwnerPerson, Tag("Person")] | Annotated[PhoneOwnerBusiness, Tag("Business")],
+    Discriminator(owner_type),
+]
 
 
 class CallerIDResponse(BaseModel):
@@ -74,22 +87,22 @@ class CallerIDResponse(BaseModel):
     id: str | None = Field(
         default=None,
         description="The persistent ID of the phone number.",
-        example="Phone.3dbb6fef-a2df-4b08-cfe3-bc7128b6f5b4",
+        examples=["Phone.3dbb6fef-a2df-4b08-cfe3-bc7128b6f5b4"],
     )
     phone_number: str | None = Field(
         default=None,
         description="The phone number in E.164 or local format.",
-        example="2069735100",
+        examples=["2069735100"],
     )
     is_valid: bool | None = Field(
         default=None,
         description="True if the phone number is valid.",
-        example=True,
+        examples=[True],
     )
     country_calling_code: str | None = Field(
         default=None,
         description="The country code of the phone number.",
-        example="1",
+        examples=["1"],
     )
     line_type: LineType | None = Field(
         default=None,
@@ -98,19 +111,19 @@ class CallerIDResponse(BaseModel):
     carrier: str | None = Field(
         default=None,
         description="The carrier providing service for the phone number.",
-        example="Trestle Telco",
+        examples=["Trestle Telco"],
     )
     is_prepaid: bool | None = Field(
         default=None,
         description="True if the phone is associated with a prepaid account.",
-        example=False,
+        examples=[False],
     )
     is_commercial: bool | None = Field(
         default=None,
         description="True if the phone number is registered to a business.",
-        example=False,
+        examples=[False],
     )
-    belongs_to: list[PhoneOwnerPerson | PhoneOwnerBusiness] | None = Field(
+    belongs_to: list[PhoneOwner] | None = Field(
         default=None,
         description="The owner(s) associated with the phone.",
     )
@@ -131,12 +144,9 @@ class CallerIDResponse(BaseModel):
         description="Warnings returned as part of the response, if applicable.",
     )
 
-    class Config:
-        """Pydantic config."""
-        json_encoders = {
-            HttpUrl: lambda v: str(v) if v else None
-        }
-        schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "id": "Phone.3dbb6fef-a2df-4b08-cfe3-bc7128b6f5b4",
                 "phone_number": "2069735100",
@@ -167,4 +177,5 @@ class CallerIDResponse(BaseModel):
                 },
                 "warnings": ["Missing Input"]
             }
-        }
+        },
+    )
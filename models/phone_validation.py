@@ -2,13 +2,9 @@
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-
-class PartialError(BaseModel):
-    """Model for partial error responses."""
-    name: str | None = None
-    message: str | None = None
+from ._common import PartialError
 
 
 class AddOnsData(BaseModel):
@@ -71,12 +67,8 @@ class PhoneValidationResponse(BaseModel):
         description="Warnings returned as part of the response, if applicable"
     )
 
-    class Config:
-        """Pydantic config."""
-        json_encoders = {
-            dict: lambda v: v if v is not None else {}
-        }
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "Phone.3dbb6fef-a2df-4b08-cfe3-bc7128b6f5b4",
                 "phone_number": "2069735100",
@@ -97,4 +89,5 @@ class PhoneValidationResponse(BaseModel):
                 },
                 "warnings": ["Missing Input"]
             }
-        }
+        },
+    )
@@ -1,8 +1,57 @@
 """Pydantic models for Real Contact API responses."""
 
-from typing import Any, Literal, Optional
+import sys
+from functools import cache
+from typing import Any, Optional, TypeVar
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from ._common import ContactGrade, LineType, PartialError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _flat_keys(prefix: str, *names: str) -> tuple[tuple[str, str], ...]:
+    """Pair each field name with its interned flat response key."""
+    return tuple((name, sys.intern(f"{prefix}.{name}")) for name in names)
+
+
+# Flat response keys for each nested model, as (field name, response key)
+_PHONE_KEYS = _flat_keys(
+    "phone", "is_valid", "activity_score", "line_type", "name_match", "contact_grade"
+)
+_EMAIL_KEYS = _flat_keys(
+    "email", "is_valid", "name_match", "contact_grade", "deliverability", "age_score"
+)
+_ADDRESS_KEYS = _flat_keys("address", "is_valid", "name_match")
+
+
+@cache
+def _empty(model: type[BaseModel]) -> Any:
+    """Return the shared instance of a frozen model with every field ``None``."""
+    return model.model_construct(**dict.fromkeys(model.model_fields))
+
+
+def _build(model: type[ModelT], validate: bool, **values: Any) -> ModelT:
+    """Build ``model`` from ``values``, validating only when asked."""
+    if validate:
+        return model.model_validate(values)
+    return model.model_construct(**values)
+
+
+def _build_info(
+    model: type[ModelT],
+    keys: tuple[tuple[str, str], ...],
+    data: dict[str, Any],
+    validate: bool,
+) -> ModelT:
+    """Build an info model from its flat keys in the response ``data``."""
+    values = {name: data.get(key) for name, key in keys}
+    if all(value is None for value in values.values()):
+        # The info models are frozen, so records missing a section
+        # can all share one empty instance instead of allocating
+        return _empty(model)
+    return _build(model, validate, **values)
 
 
 class PhoneInfo(BaseModel):
@@ -17,16 +66,7 @@ class PhoneInfo(BaseModel):
         ge=0,
         le=100,
     )
-    line_type: Literal[
-        "Landline",
-        "Premium",
-        "NonFixedVOIP",
-        "Mobile",
-        "FixedVOIP",
-        "TollFree",
-        "Other",
-        "Voicemail",
-    ] | None = Field(
+    line_type: LineType | None = Field(
         default=None,
         description="The line type of the phone number.",
     )
@@ -34,11 +74,13 @@ class PhoneInfo(BaseModel):
         default=None,
         description="A match/no match indicator for the name associated with the phone.",
     )
-    contact_grade: Literal["A", "B", "C", "D", "F"] | None = Field(
+    contact_grade: ContactGrade | None = Field(
         default=None,
         description="An A–F grade determining the quality of the lead's phone.",
     )
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class EmailInfo(BaseModel):
     """Email information from Real Contact API response."""
@@ -50,7 +92,7 @@ class EmailInfo(BaseModel):
         default=None,
         description="A match/no match indicator for the name associated with the email.",
     )
-    contact_grade: Literal["A", "B", "C", "D", "F"] | None = Field(
+    contact_grade: ContactGrade | None = Field(
         default=None,
         description="An A–F grade determining the quality of the lead's email.",
     )
@@ -65,6 +107,8 @@ class EmailInfo(BaseModel):
         le=100,
     )
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class AddressInfo(BaseModel):
     """Address information from Real Contact API response."""
@@ -77,6 +121,8 @@ class AddressInfo(BaseModel):
         description="A match/no match indicator for the name associated with the address.",
     )
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class LitigatorChecks(BaseModel):
     """Litigator checks information (if add-on enabled)."""
@@ -91,17 +137,15 @@ class LitigatorChecks(BaseModel):
         le=100,
     )
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class AddOnsResponse(BaseModel):
     """Add-ons response data."""
     litigator_checks: LitigatorChecks | None = None
     email_checks: dict[str, Any] | None = None
 
-
-class PartialError(BaseModel):
-    """Partial error response model."""
-    name: str | None = None
-    message: str | None = None
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class RealContactResponse(BaseModel):
@@ -113,8 +157,8 @@ class RealContactResponse(BaseModel):
     error: PartialError | None = None
     warnings: list[str] | None = None
 
-    @classmethod
     @field_validator("warnings", mode="before")
+    @classmethod
     def validate_warnings(cls, v: Any) -> list[str] | None:
         """Convert single warning string to list if needed."""
         if v is None:
@@ -126,34 +170,21 @@ class RealContactResponse(BaseModel):
         return None
 
     @classmethod
-    def from_api_response(cls, data: dict[str, Any]) -> "RealContactResponse":
+    def from_api_response(
+        cls, data: dict[str, Any], validate: bool = True
+    ) -> "RealContactResponse":
         """Create a RealContactResponse from the raw API response.
         
         This handles the flat structure of the API response and maps it to our nested model.
+
+        Every model is validated by default. Pass ``validate=False`` to build
+        them with ``model_construct`` instead, skipping validation of values
+        copied straight from a trusted response.
         """
-        # Extract phone info
-        phone = PhoneInfo(
-            is_valid=data.get("phone.is_valid"),
-            activity_score=data.get("phone.activity_score"),
-            line_type=data.get("phone.line_type"),
-            name_match=data.get("phone.name_match"),
-            contact_grade=data.get("phone.contact_grade"),
-        )
-        
-        # Extract email info
-        email = EmailInfo(
-            is_valid=data.get("email.is_valid"),
-            name_match=data.get("email.name_match"),
-            contact_grade=data.get("email.contact_grade"),
-            deliverability=data.get("email.deliverability"),
-            age_score=data.get("email.age_score"),
-        )
-        
-        # Extract address info
-        address = AddressInfo(
-            is_valid=data.get("address.is_valid"),
-            name_match=data.get("address.name_match"),
-        )
+        # Extract phone, email and address info
+        phone = _build_info(PhoneInfo, _PHONE_KEYS, data, validate)
+        email = _build_info(EmailInfo, _EMAIL_KEYS, data, validate)
+        address = _build_info(AddressInfo, _ADDRESS_KEYS, data, validate)
         
         # Handle add-ons if present
         add_ons_data = data.get("add_ons", {})
@@ -161,13 +192,18 @@ class RealContactResponse(BaseModel):
         
         if add_ons_data:
             litigator_checks = None
-            if "litigator_checks" in add_ons_data:
-                litigator_checks = LitigatorChecks(
-                    is_litigator=add_ons_data["litigator_checks"].get("is_litigator"),
-                    risk_score=add_ons_data["litigator_checks"].get("risk_score"),
+            litigator_data = add_ons_data.get("litigator_checks")
+            if litigator_data is not None:
+                litigator_checks = _build(
+                    LitigatorChecks,
+                    validate,
+                    is_litigator=litigator_data.get("is_litigator"),
+                    risk_score=litigator_data.get("risk_score"),
                 )
             
-            add_ons = AddOnsResponse(
+            add_ons = _build(
+                AddOnsResponse,
+                validate,
                 litigator_checks=litigator_checks,
                 email_checks=add_ons_data.get("email_checks"),
             )
@@ -176,23 +212,27 @@ class RealContactResponse(BaseModel):
         error_data = data.get("error")
         error = None
         if error_data:
-            error = PartialError(
+            error = _build(
+                PartialError,
+                validate,
                 name=error_data.get("name"),
                 message=error_data.get("message"),
             )
         
-        return cls(
+        # model_construct skips the warnings validator, so normalize here
+        warnings = data.get("warnings")
+        if not validate:
+            warnings = cls.validate_warnings(warnings)
+
+        return _build(
+            cls,
+            validate,
             phone=phone,
             email=email,
             address=address,
             add_ons=add_ons,
             error=error,
-            warnings=data.get("warnings"),
+            warnings=warnings,
         )
 
-    class Config:
-        """Pydantic config."""
-        json_encoders = {
-            dict: lambda v: v if v is not None else {}
-        }
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
@@ -1,8 +1,10 @@
 """Pydantic models for Reverse Address API responses."""
 
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag
+
+from ._common import PartialError, owner_type
 
 
 class Coordinates(BaseModel):
@@ -20,6 +22,8 @@ class Coordinates(BaseModel):
         description="Accuracy level of the coordinates"
     )
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class ResidentPerson(BaseModel):
     """Model for a person resident at an address."""
@@ -51,6 +55,12 @@ class ResidentPerson(BaseModel):
         default=None,
         description="Gender of the person"
     )
+    type: Literal["Person"] = Field(
+        default="Person",
+        description="Type of resident"
+    )
+
+    model_config = ConfigDict(defer_build=True)
 
 
 class ResidentBusiness(BaseModel):
@@ -75,12 +85,19 @@ class ResidentBusiness(BaseModel):
         default=None,
         description="Website URL of the business"
     )
+    type: Literal["Business"] = Field(
+        default="Business",
+        description="Type of resident"
+    )
+
+    model_config = ConfigDict(defer_build=True)
 
 
-class PartialError(BaseModel):
-    """Model for partial error responses."""
-    name: str | None = None
-    message: str | None = None
+Resident = Annotated[
+    Annotated[ResidentPerson, Tag("Person")] | Annotated[ResidentBusiness, Tag("Business")],
+    Discriminator(owner_type),
+]
+"""A current resident, validated against the model its ``type`` tag names."""
 
 
 class ReverseAddressResponse(BaseModel):
@@ -138,7 +155,7 @@ class ReverseAddressResponse(BaseModel):
         default=None,
         description="Type of delivery point"
     )
-    current_residents: list[ResidentPerson | ResidentBusiness] | None = Field(
+    current_residents: list[Resident] | None = Field(
         default=None,
         description="Current residents at the address"
     )
@@ -151,12 +168,9 @@ class ReverseAddressResponse(BaseModel):
         description="Warnings returned as part of the response, if applicable"
     )
 
-    class Config:
-        """Pydantic config."""
-        json_encoders = {
-            dict: lambda v: v if v is not None else {}
-        }
-        schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "id": "Location.d1a40ed5-a70a-46f8-80a9-bb4ac27e3a01",
                 "is_valid": True,
@@ -182,4 +196,5 @@ class ReverseAddressResponse(BaseModel):
                 },
                 "warnings": ["Missing Input"]
             }
-        }
+        },
+    )
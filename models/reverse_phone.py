@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any
+from functools import cached_property
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, HttpUrl, Tag
 
+from ._common import LineType, PartialError, RawObject, RawObjectList, owner_type
 
-class LineType(str, Enum):
-    """Enumeration of possible phone line types."""
+
+class LineTypeEnum(str, Enum):
+    """Enumeration of possible phone line types.
+
+    ``ReversePhoneResponse.line_type`` is a plain string; because this is a
+    ``str`` enum its members still compare equal to it.
+    """
     LANDLINE = "Landline"
     PREMIUM = "Premium"
     NON_FIXED_VOIP = "NonFixedVOIP"
@@ -18,12 +25,6 @@ class LineType(str, Enum):
     VOICEMAIL = "Voicemail"
 
 
-class PartialError(BaseModel):
-    """Model for partial error responses."""
-    name: str | None = None
-    message: str | None = None
-
-
 class ReversePhoneOwnerPerson(BaseModel):
     """Model for a person associated with a phone number."""
     id: str | None = None
@@ -33,16 +34,24 @@ class ReversePhoneOwnerPerson(BaseModel):
     middle_name: str | None = None
     age_range: str | None = None
     gender: str | None = None
-    link: HttpUrl | None = None
-    location: dict[str, Any] | None = None
-    address: dict[str, Any] | None = None
-    phones: list[dict[str, Any]] | None = None
-    emails: list[dict[str, Any]] | None = None
-    relatives: list[dict[str, Any]] | None = None
-    associates: list[dict[str, Any]] | None = None
-    education: list[dict[str, Any]] | None = None
-    employment: list[dict[str, Any]] | None = None
-    profiles: dict[str, Any] | None = None
+    type: Literal["Person"] = "Person"
+    link: str | None = None
+    location: RawObject = None
+    address: RawObject = None
+    phones: RawObjectList = None
+    emails: RawObjectList = None
+    relatives: RawObjectList = None
+    associates: RawObjectList = None
+    education: RawObjectList = None
+    employment: RawObjectList = None
+    profiles: RawObject = None
+
+    @cached_property
+    def link_url(self) -> HttpUrl | None:
+        """The ``link`` parsed as an ``HttpUrl``, on first access only."""
+        return HttpUrl(self.link) if self.link else None
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class ReversePhoneOwnerBusiness(BaseModel):
@@ -54,13 +63,29 @@ class ReversePhoneOwnerBusiness(BaseModel):
     founded: int | None = None
     employee_count: str | None = None
     industry: str | None = None
-    link: HttpUrl | None = None
-    location: dict[str, Any] | None = None
-    address: dict[str, Any] | None = None
-    phones: list[dict[str, Any]] | None = None
-    emails: list[dict[str, Any]] | None = None
+    type: Literal["Business"] = "Business"
+    link: str | None = None
+    location: RawObject = None
+    address: RawObject = None
+    phones: RawObjectList = None
+    emails: RawObjectList = None
     categories: list[str] | None = None
-    profiles: dict[str, Any] | None = None
+    profiles: RawObject = None
+
+    @cached_property
+    def link_url(self) -> HttpUrl | None:
+        """The ``link`` parsed as an ``HttpUrl``, on first access only."""
+        return HttpUrl(self.link) if self.link else None
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+
+ReversePhoneOwner = Annotated[
+    Annotated[ReversePhoneOwnerPerson, Tag("Person")]
+    | Annotated[ReversePhoneOwnerBusiness, Tag("Business")],
+    Discriminator(owner_type),
+]
+"""A phone owner, validated against the model its ``type`` tag names."""
 
 
 class ReversePhoneResponse(BaseModel):
@@ -68,22 +93,22 @@ class ReversePhoneResponse(BaseModel):
     id: str | None = Field(
         default=None,
         description="The persistent ID of the phone number.",
-        example="Phone.3dbb6fef-a2df-4b08-cfe3-bc7128b6f5b4",
+        examples=["Phone.3dbb6fef-a2df-4b08-cfe3-bc7128b6f5b4"],
     )
     phone_number: str | None = Field(
         default=None,
         description="The phone number in E.164 or local format.",
-        example="2069735100",
+        examples=["2069735100"],
     )
     is_valid: bool | None = Field(
         default=None,
         description="True if the phone number is valid.",
-        example=True,
+        examples=[True],
     )
     country_calling_code: str | None = Field(
         default=None,
         description="The country code of the phone number.",
-        example="1",
+        examples=["1"],
     )
     line_type: LineType | None = Field(
         default=None,
@@ -92,19 +117,19 @@ class ReversePhoneResponse(BaseModel):
     carrier: str | None = Field(
         default=None,
         description="The carrier providing service for the phone number.",
-        example="Trestle Telco",
+        examples=["Trestle Telco"],
     )
     is_prepaid: bool | None = Field(
         default=None,
         description="True if the phone is associated with a prepaid account.",
-        example=False,
+        examples=[False],
     )
     is_commercial: bool | None = Field(
         default=None,
         description="True if the phone number is registered to a business.",
-        example=False,
+        examples=[False],
     )
-    owners: list[ReversePhoneOwnerPerson | ReversePhoneOwnerBusiness] | None = Field(
+    owners: list[ReversePhoneOwner] | None = Field(
         default=None,
         description="The owner(s) associated with the phone.",
     )
@@ -117,11 +142,10 @@ class ReversePhoneResponse(BaseModel):
         description="Warnings returned as part of the response, if applicable.",
     )
 
-    class Config:
-        json_encoders = {
-            HttpUrl: lambda v: str(v) if v else None
-        }
-        schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "id": "Phone.3dbb6fef-a2df-4b08-cfe3-bc7128b6f5b4",
                 "phone_number": "2069735100",
@@ -138,4 +162,5 @@ class ReversePhoneResponse(BaseModel):
                 },
                 "warnings": ["Missing Input"]
             }
-        }
+        },
+    )
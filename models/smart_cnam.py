@@ -2,13 +2,9 @@
 
 from typing import Any
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
-
-class PartialError(BaseModel):
-    """Model for partial error responses."""
-    name: str | None = None
-    message: str | None = None
+from ._common import PartialError
 
 
 class PhoneOwnerPersonSmartCNAM(BaseModel):
@@ -34,13 +30,15 @@ class PhoneOwnerPersonSmartCNAM(BaseModel):
         description="Last name of the person"
     )
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class SmartCNAMResponse(BaseModel):
     """Response model for the Smart CNAM API."""
     id: str | None = Field(
         default=None,
         description="The persistent ID of the phone number",
-        example="Phone.3dbb6fef-a2df-4b08-cfe3-bc7128b6f5b4"
+        examples=["Phone.3dbb6fef-a2df-4b08-cfe3-bc7128b6f5b4"]
     )
     is_valid: bool | None = Field(
         default=None,
@@ -59,12 +57,10 @@ class SmartCNAMResponse(BaseModel):
         description="Warnings returned as part of the response, if applicable"
     )
 
-    class Config:
-        """Pydantic config."""
-        json_encoders = {
-            dict: lambda v: v if v is not None else {}
-        }
-        schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "id": "Phone.3dbb6fef-a2df-4b08-cfe3-bc7128b6f5b4",
                 "is_valid": True,
@@ -81,4 +77,5 @@ class SmartCNAMResponse(BaseModel):
                 },
                 "warnings": ["Missing Input"]
             }
-        }
+        },
+    )
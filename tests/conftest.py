@@ -0,0 +1,13 @@
+"""Test configuration: import the SDK as ``trestle`` straight from the repo."""
+
+import importlib.machinery
+import importlib.util
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[1]
+
+if "trestle" not in sys.modules:
+    _spec = importlib.machinery.ModuleSpec("trestle", None, is_package=True)
+    _spec.submodule_search_locations = [str(_ROOT)]
+    sys.modules["trestle"] = importlib.util.module_from_spec(_spec)
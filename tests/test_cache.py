@@ -0,0 +1,187 @@
+"""Tests for the shared response cache."""
+
+import asyncio
+import types
+
+import httpx
+import pytest
+
+from trestle.api import _common
+from trestle.api._common import ResponseCache
+from trestle.api.caller_identification.caller_id import CallerIDAPI
+from trestle.exceptions import RateLimitExceededError
+
+
+class _Clock:
+    """Manually advanced stand-in for ``time.monotonic``."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(_common, "time", types.SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+def _counting_fetch(calls: list[str], value: str, delay: float = 0.0):
+    async def fetch() -> str:
+        calls.append(value)
+        await asyncio.sleep(delay)
+        return value
+
+    return fetch
+
+
+def test_concurrent_lookups_share_one_fetch() -> None:
+    async def main() -> None:
+        cache: ResponseCache[str] = ResponseCache()
+        calls: list[str] = []
+        fetch = _counting_fetch(calls, "result", delay=0.01)
+        results = await asyncio.gather(*(cache.get_or_fetch("key", fetch) for _ in range(5)))
+        assert results == ["result"] * 5
+        assert calls == ["result"]
+
+    asyncio.run(main())
+
+
+def test_cancelling_first_caller_does_not_cancel_waiters() -> None:
+    async def main() -> None:
+        cache: ResponseCache[str] = ResponseCache()
+        calls: list[str] = []
+        fetch = _counting_fetch(calls, "result", delay=0.01)
+        first = asyncio.create_task(cache.get_or_fetch("key", fetch))
+        second = asyncio.create_task(cache.get_or_fetch("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == "result"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert calls == ["result"]
+        # The fetch still completed, so the response was cached
+        assert await cache.get_or_fetch("key", fetch) == "result"
+        assert calls == ["result"]
+
+    asyncio.run(main())
+
+
+def test_failures_are_not_cached() -> None:
+    async def main() -> None:
+        cache: ResponseCache[str] = ResponseCache()
+        attempts = 0
+
+        async def fetch() -> str:
+            nonlocal attempts
+            attempts += 1
+            raise ValueError("boom")
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await cache.get_or_fetch("key", fetch)
+        assert attempts == 2
+
+    asyncio.run(main())
+
+
+def test_throttled_key_raises_fresh_error_with_time_left(clock: _Clock) -> None:
+    async def main() -> None:
+        cache: ResponseCache[str] = ResponseCache(throttle_error=RateLimitExceededError)
+        attempts = 0
+
+        async def fetch() -> str:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise RateLimitExceededError(retry_after=30)
+            return "result"
+
+        with pytest.raises(RateLimitExceededError) as original:
+            await cache.get_or_fetch("key", fetch)
+        clock.now += 10
+        with pytest.raises(RateLimitExceededError) as first_hit:
+            await cache.get_or_fetch("key", fetch)
+        with pytest.raises(RateLimitExceededError) as second_hit:
+            await cache.get_or_fetch("key", fetch)
+        assert attempts == 1
+        assert first_hit.value is not original.value
+        assert first_hit.value is not second_hit.value
+        assert first_hit.value.retry_after == pytest.approx(20)
+        clock.now += 21
+        assert await cache.get_or_fetch("key", fetch) == "result"
+        assert attempts == 2
+
+    asyncio.run(main())
+
+
+def test_entries_expire_after_ttl(clock: _Clock) -> None:
+    async def main() -> None:
+        cache: ResponseCache[str] = ResponseCache(ttl=60)
+        calls: list[str] = []
+        fetch = _counting_fetch(calls, "result")
+        await cache.get_or_fetch("key", fetch)
+        clock.now += 59
+        await cache.get_or_fetch("key", fetch)
+        assert len(calls) == 1
+        clock.now += 2
+        await cache.get_or_fetch("key", fetch)
+        assert len(calls) == 2
+
+    asyncio.run(main())
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    async def main() -> None:
+        cache: ResponseCache[str] = ResponseCache(max_size=2)
+        calls: list[str] = []
+        for key in ("a", "b"):
+            await cache.get_or_fetch(key, _counting_fetch(calls, key))
+        # Touch "a" so "b" is the least recently used
+        await cache.get_or_fetch("a", _counting_fetch(calls, "a"))
+        await cache.get_or_fetch("c", _counting_fetch(calls, "c"))
+        assert calls == ["a", "b", "c"]
+        await cache.get_or_fetch("a", _counting_fetch(calls, "a"))
+        assert calls == ["a", "b", "c"]
+        await cache.get_or_fetch("b", _counting_fetch(calls, "b"))
+        assert calls == ["a", "b", "c", "b"]
+
+    asyncio.run(main())
+
+
+def test_zero_size_still_coalesces_but_does_not_cache() -> None:
+    async def main() -> None:
+        cache: ResponseCache[str] = ResponseCache(max_size=0)
+        calls: list[str] = []
+        fetch = _counting_fetch(calls, "result", delay=0.01)
+        await asyncio.gather(cache.get_or_fetch("key", fetch), cache.get_or_fetch("key", fetch))
+        assert calls == ["result"]
+        await cache.get_or_fetch("key", fetch)
+        assert calls == ["result", "result"]
+
+    asyncio.run(main())
+
+
+def test_cancelled_caller_id_lookup_leaves_concurrent_lookup_intact() -> None:
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"phone_number": "2069735100", "is_valid": True})
+
+    async def main() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            api = CallerIDAPI(client, "https://api.example.com", "key")
+            first = asyncio.create_task(api.lookup_caller("2069735100"))
+            second = asyncio.create_task(api.lookup_caller("2069735100"))
+            await asyncio.sleep(0)
+            first.cancel()
+            response = await second
+            assert response.is_valid is True
+            assert len(requests) == 1
+
+    asyncio.run(main())
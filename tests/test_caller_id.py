@@ -0,0 +1,40 @@
+"""Tests for Caller ID owner validation."""
+
+import pydantic
+import pytest
+
+from trestle.api.caller_identification import _responses
+from trestle.models import caller_id
+
+
+@pytest.mark.parametrize("module", [caller_id, _responses])
+def test_untagged_owner_validates_as_person(module) -> None:
+    response = module.CallerIDResponse.model_validate_json(b'{"belongs_to":[{"name":"x"}]}')
+    (owner,) = response.belongs_to
+    assert isinstance(owner, module.PhoneOwnerPerson)
+    assert owner.name == "x"
+
+
+@pytest.mark.parametrize("module", [caller_id, _responses])
+def test_untagged_owner_with_business_key_validates_as_business(module) -> None:
+    response = module.CallerIDResponse.model_validate_json(
+        b'{"belongs_to":[{"name":"Acme","founded":1999}]}'
+    )
+    (owner,) = response.belongs_to
+    assert isinstance(owner, module.PhoneOwnerBusiness)
+    assert owner.founded == 1999
+
+
+@pytest.mark.parametrize("module", [caller_id, _responses])
+def test_untagged_person_with_industry_validates_as_person(module) -> None:
+    response = module.CallerIDResponse.model_validate_json(
+        b'{"belongs_to":[{"firstname":"Jane","lastname":"Doe","industry":"Retail"}]}'
+    )
+    (owner,) = response.belongs_to
+    assert isinstance(owner, module.PhoneOwnerPerson)
+    assert (owner.firstname, owner.lastname, owner.industry) == ("Jane", "Doe", "Retail")
+
+
+def test_owner_that_is_not_an_object_fails_validation() -> None:
+    with pytest.raises(pydantic.ValidationError, match="union_tag_not_found"):
+        caller_id.CallerIDResponse.model_validate_json(b'{"belongs_to":["Jane"]}')
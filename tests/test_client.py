@@ -0,0 +1,51 @@
+"""Tests for the top-level Trestle API client."""
+
+import asyncio
+import warnings
+
+import httpx
+import pytest
+
+from trestle.client import TrestleAPIClient, TrestleConfig
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> TrestleAPIClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={})
+
+    monkeypatch.setattr(
+        TrestleAPIClient,
+        "_make_client",
+        lambda self: httpx.AsyncClient(
+            base_url=self._config.base_url, transport=httpx.MockTransport(handler)
+        ),
+    )
+    return TrestleAPIClient(TrestleConfig(api_key="key"))
+
+
+def test_client_can_be_entered_again_after_closing(client: TrestleAPIClient) -> None:
+    async def main() -> None:
+        async with client:
+            first = client.reverse_phone
+        async with client:
+            assert not client._client.is_closed
+            assert client.reverse_phone is not first
+            assert client.reverse_phone._client is client._client
+            assert await client.is_healthy()
+
+    asyncio.run(main())
+
+
+def test_bulk_lookup_returns_bad_address_arguments_as_that_lookups_result(
+    client: TrestleAPIClient,
+) -> None:
+    async def main() -> dict:
+        async with client:
+            return await client.bulk_lookup("2069735100", address={"street": "100 Syrws St"})
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        results = asyncio.run(main())
+    assert isinstance(results["reverse_address"], TypeError)
+    assert results.keys() == {"reverse_phone", "smart_cnam", "reverse_address"}
@@ -0,0 +1,211 @@
+"""Tests for the shared API helpers."""
+
+import asyncio
+import types
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from trestle.api import _common
+from trestle.api._common import (
+    AIMDLimiter,
+    RateLimitTracker,
+    TokenBucket,
+    call_with_retries,
+    is_valid_phone,
+    retry_after_from_headers,
+)
+from trestle.api.caller_identification.caller_id import _ERRORS
+from trestle.exceptions import APIError
+
+
+class _Clock:
+    """Manually advanced stand-in for ``time``; sleeping advances it."""
+
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(
+        _common, "time", types.SimpleNamespace(monotonic=clock.monotonic, time=clock.time)
+    )
+    monkeypatch.setattr(_common.asyncio, "sleep", clock.sleep)
+    return clock
+
+
+@pytest.mark.parametrize("phone", ["2069735100", "+12069735100", "(206) 973-5100", "206.973.5100"])
+def test_valid_phone_formats(phone: str) -> None:
+    assert is_valid_phone(phone)
+
+
+@pytest.mark.parametrize("phone", ["", "12345", "+0123456789", "206-973-51OO", "+1234567890123456"])
+def test_invalid_phone_formats(phone: str) -> None:
+    assert not is_valid_phone(phone)
+
+
+def test_transport_errors_are_retried_then_wrapped() -> None:
+    calls = []
+
+    async def call() -> str:
+        calls.append(None)
+        raise httpx.ConnectError("connection refused")
+
+    with pytest.raises(APIError) as excinfo:
+        asyncio.run(call_with_retries(call, _ERRORS, "call", lambda *_: 0.0, max_attempts=3))
+    assert len(calls) == 3
+    assert excinfo.value.status_code == 0
+    assert isinstance(excinfo.value.__cause__, httpx.ConnectError)
+
+
+def test_tracker_counts_admitted_requests_against_the_budget(clock: _Clock) -> None:
+    tracker = RateLimitTracker()
+    tracker.update(
+        httpx.Headers(
+            {"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "12", "X-RateLimit-Reset": "30"}
+        )
+    )
+
+    async def main() -> None:
+        await tracker.wait()
+        await tracker.wait()
+        assert clock.sleeps == []
+        await tracker.wait()
+
+    asyncio.run(main())
+    assert clock.sleeps == [30.0]
+
+
+def test_tracker_caps_the_wait_for_a_distant_reset(clock: _Clock) -> None:
+    tracker = RateLimitTracker()
+    reset = str(int(clock.now) + 86_400)
+    tracker.update(httpx.Headers({"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": reset}))
+
+    asyncio.run(tracker.wait())
+    assert clock.sleeps == [_common.MAX_RETRY_AFTER]
+
+
+def _respond(clock: _Clock, status_code: int = 200, latency: float = 0.0):
+    async def call() -> httpx.Response:
+        clock.now += latency
+        return httpx.Response(status_code)
+
+    return call
+
+
+def test_limiter_grows_by_half_a_request_per_fast_success(clock: _Clock) -> None:
+    limiter = AIMDLimiter(initial_limit=4, max_limit=5)
+
+    async def main() -> None:
+        await limiter.run(_respond(clock))
+        assert limiter.limit == 4
+        await limiter.run(_respond(clock))
+        assert limiter.limit == 5
+        await limiter.run(_respond(clock))
+        await limiter.run(_respond(clock))
+        assert limiter.limit == 5
+
+    asyncio.run(main())
+
+
+def test_limiter_halves_at_most_once_per_latency_target(clock: _Clock) -> None:
+    limiter = AIMDLimiter(initial_limit=8, latency_target=2.0)
+
+    async def main() -> None:
+        await limiter.run(_respond(clock, 503))
+        assert limiter.limit == 4
+        await limiter.run(_respond(clock, 429))
+        assert limiter.limit == 4
+        clock.now += 2.0
+        await limiter.run(_respond(clock, 429))
+        assert limiter.limit == 2
+
+    asyncio.run(main())
+
+
+def test_limiter_halves_on_slow_responses_and_transport_errors(clock: _Clock) -> None:
+    limiter = AIMDLimiter(initial_limit=8, latency_target=2.0)
+
+    async def fail() -> httpx.Response:
+        raise httpx.ConnectError("connection refused")
+
+    async def main() -> None:
+        await limiter.run(_respond(clock, latency=3.0))
+        assert limiter.limit == 4
+        clock.now += 2.0
+        with pytest.raises(httpx.ConnectError):
+            await limiter.run(fail)
+        assert limiter.limit == 2
+
+    asyncio.run(main())
+
+
+def test_token_bucket_admits_a_burst_then_paces_requests(clock: _Clock) -> None:
+    bucket = TokenBucket(rate=2.0, capacity=2.0)
+
+    async def main() -> None:
+        for _ in range(4):
+            await bucket.acquire()
+
+    asyncio.run(main())
+    assert clock.sleeps == [0.5, 0.5]
+
+
+def test_tracker_waits_only_below_the_threshold_then_resets(clock: _Clock) -> None:
+    tracker = RateLimitTracker()
+
+    async def main() -> None:
+        tracker.update(
+            httpx.Headers(
+                {"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "50", "X-RateLimit-Reset": "10"}
+            )
+        )
+        await tracker.wait()
+        assert clock.sleeps == []
+        tracker.update(
+            httpx.Headers(
+                {"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "10"}
+            )
+        )
+        await tracker.wait()
+        assert clock.sleeps == [10.0]
+        # The budget is unknown until the next response reports it
+        await tracker.wait()
+        assert clock.sleeps == [10.0]
+
+    asyncio.run(main())
+
+
+def test_retry_after_in_seconds() -> None:
+    assert retry_after_from_headers(httpx.Headers({"Retry-After": "7"})) == 7.0
+
+
+def test_retry_after_as_http_date(clock: _Clock) -> None:
+    headers = httpx.Headers({"Retry-After": formatdate(clock.now + 30, usegmt=True)})
+    assert retry_after_from_headers(headers) == 30.0
+
+
+def test_retry_after_falls_back_to_rate_limit_reset(clock: _Clock) -> None:
+    assert retry_after_from_headers(httpx.Headers({"X-RateLimit-Reset": "12"})) == 12.0
+    epoch = httpx.Headers({"X-RateLimit-Reset": str(int(clock.now) + 45)})
+    assert retry_after_from_headers(epoch) == 45.0
+    assert retry_after_from_headers(httpx.Headers()) is None
+
+
+def test_retry_after_is_capped() -> None:
+    headers = httpx.Headers({"Retry-After": "999999"})
+    assert retry_after_from_headers(headers) == _common.RETRY_AFTER_LIMIT
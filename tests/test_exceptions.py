@@ -0,0 +1,21 @@
+"""Tests for the per-API exception hierarchies."""
+
+from trestle.api.caller_identification._exceptions import CallerIDAPIError
+from trestle.api.caller_identification._exceptions import (
+    InvalidPhoneNumberError as CallerIDInvalidPhoneNumberError,
+)
+from trestle.api.find_person._exceptions import FindPersonAPIError, InvalidSearchCriteriaError
+from trestle.exceptions import TrestleAPIError
+
+
+def test_package_bases_are_distinct_subclasses_of_the_shared_base() -> None:
+    assert CallerIDAPIError is not FindPersonAPIError
+    assert issubclass(CallerIDAPIError, TrestleAPIError)
+    assert issubclass(FindPersonAPIError, TrestleAPIError)
+
+
+def test_domain_errors_derive_from_their_package_base() -> None:
+    error = InvalidSearchCriteriaError("Invalid search criteria")
+    assert isinstance(error, FindPersonAPIError)
+    assert not isinstance(error, CallerIDAPIError)
+    assert issubclass(CallerIDInvalidPhoneNumberError, CallerIDAPIError)
@@ -0,0 +1,73 @@
+"""Tests for Real Contact request serialization and response validation."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from trestle.api.real_contact._requests import (
+    AddOns,
+    AddressRequest,
+    BusinessRequest,
+    RealContactRequest,
+)
+from trestle.api.real_contact.real_contact import RealContactAPI
+from trestle.exceptions import ValidationError
+
+_REQUEST = RealContactRequest(
+    name="John Smith",
+    phone="(206) 973-5100",
+    address=AddressRequest(**{"address.city": "Lynden"}),
+    business=BusinessRequest(**{"business.name": "Acme"}),
+    add_ons=[AddOns.LITIGATOR_CHECKS, AddOns.EMAIL_CHECKS_AGE],
+)
+_BOGUS_RESPONSE = {"phone.is_valid": True, "phone.line_type": "Bogus", "phone.activity_score": 500}
+
+
+def test_request_dumps_flat_query_parameters() -> None:
+    assert _REQUEST.model_dump() == {
+        "name": "John Smith",
+        "phone": "2069735100",
+        "address.city": "Lynden",
+        "address.country_code": "US",
+        "business.name": "Acme",
+        "add_ons": "litigator_checks,email_checks_age",
+    }
+
+
+def test_request_dump_honours_include_and_exclude() -> None:
+    assert "name" not in _REQUEST.model_dump(exclude={"name"})
+    assert _REQUEST.model_dump(include={"phone", "address"}) == {
+        "phone": "2069735100",
+        "address.city": "Lynden",
+        "address.country_code": "US",
+    }
+
+
+def test_request_json_dump_matches_dict_dump() -> None:
+    assert json.loads(_REQUEST.model_dump_json()) == _REQUEST.model_dump()
+    assert _REQUEST.model_dump(mode="json") == _REQUEST.model_dump()
+
+
+def _verify(**api_kwargs) -> object:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=_BOGUS_RESPONSE)
+
+    async def main() -> object:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            api = RealContactAPI(client, "https://api.example.com", "key", **api_kwargs)
+            return await api.verify_contact(name="John Smith", phone="2069735100")
+
+    return asyncio.run(main())
+
+
+def test_responses_are_validated_by_default() -> None:
+    with pytest.raises(ValidationError):
+        _verify()
+
+
+def test_validation_can_be_turned_off() -> None:
+    response = _verify(validate_responses=False)
+    assert response.phone.line_type == "Bogus"
+    assert response.phone.activity_score == 500
@@ -0,0 +1,38 @@
+"""Tests for Reverse Phone response handling."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from trestle.api.reverse_phone.reverse_phone import ReversePhoneAPI
+from trestle.exceptions import RateLimitExceededError, ValidationError
+from trestle.models.reverse_phone import ReversePhoneResponse
+
+
+def _lookup(body: dict, status_code: int = 200) -> ReversePhoneResponse:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code, json=body)
+
+    async def main() -> ReversePhoneResponse:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            api = ReversePhoneAPI(client, "https://api.example.com", "key", max_retries=1)
+            return await api.lookup_phone("2069735100")
+
+    return asyncio.run(main())
+
+
+def test_lookup_returns_the_public_response_model() -> None:
+    response = _lookup({"phone_number": "2069735100", "owners": [{"name": "Jane"}]})
+    assert isinstance(response, ReversePhoneResponse)
+    assert response.owners[0].name == "Jane"
+
+
+def test_invalid_response_raises_validation_error() -> None:
+    with pytest.raises(ValidationError, match="Invalid response data"):
+        _lookup({"line_type": "Bogus"})
+
+
+def test_rate_limit_error_is_raised_unwrapped() -> None:
+    with pytest.raises(RateLimitExceededError):
+        _lookup({}, status_code=429)